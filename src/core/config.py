@@ -49,6 +49,7 @@ class UISettings:
     window_y: int = -1
     show_log_panel: bool = True
     log_panel_height: int = 150
+    import_dir: str = ""  # Last folder used to import URL lists
 
 
 @dataclass
@@ -93,6 +94,8 @@ class Config:
         self._initialized = True
         self._config_dir = self._get_config_directory()
         self._config_file = self._config_dir / "settings.json"
+        self._cache_dir = self._config_dir.parent / "cache"
+        self._dirty = False
         self.settings = self._load_settings()
     
     def _get_config_directory(self) -> Path:
@@ -103,6 +106,12 @@ class Config:
         config_dir.mkdir(exist_ok=True)
         return config_dir
     
+    @property
+    def cache_dir(self) -> Path:
+        """Get the cache directory (created on first use)."""
+        self._cache_dir.mkdir(exist_ok=True)
+        return self._cache_dir
+    
     def _load_settings(self) -> AppSettings:
         """Load settings from file."""
         if self._config_file.exists():
@@ -140,9 +149,19 @@ class Config:
             
             with open(self._config_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
+            self._dirty = False
         except Exception as e:
             print(f"Error saving config: {e}")
     
+    def mark_dirty(self):
+        """Mark settings as changed without writing them yet."""
+        self._dirty = True
+    
+    def save_if_dirty(self):
+        """Save settings only if they changed since the last save."""
+        if self._dirty:
+            self.save()
+    
     def reset(self):
         """Reset settings to defaults."""
         self.settings = AppSettings()
@@ -0,0 +1,113 @@
+"""
+YT-DLP GUI - Video Info Cache
+On-disk URL -> VideoInfo cache to avoid repeated yt-dlp extractions.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+from .config import get_config
+from .ytdlp_wrapper import VideoInfo
+from ..utils.logger import get_logger
+
+
+class InfoCache:
+    """Caches extracted video info by URL with a time-to-live."""
+    
+    TTL_SECONDS = 24 * 60 * 60
+    SIZE_LIMIT = 64 * 1024 * 1024
+    PRUNE_TARGET = 48 * 1024 * 1024  # prune below the limit so it isn't hit on every write
+    
+    def __init__(self):
+        self.logger = get_logger()
+        self._cache_dir = get_config().cache_dir / "meta"
+        self._cache_dir.mkdir(exist_ok=True)
+        # Running total of entry sizes, so writes don't have to rescan the directory
+        self._total_size = sum(f.stat().st_size for f in self._cache_dir.iterdir() if f.is_file())
+    
+    def _path_for(self, url: str) -> Path:
+        """Get the cache file for a URL."""
+        return self._cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+    
+    def get(self, url: str) -> Optional[VideoInfo]:
+        """Get cached info for URL, or None if missing or expired."""
+        path = self._path_for(url)
+        if not path.exists():
+            return None
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            timestamp = data['timestamp']
+            info = VideoInfo.from_stored_dict(data['info'])
+        except Exception as e:
+            self.logger.debug(f"Dropping unreadable info cache entry: {e}")
+            self._remove(path)
+            return None
+        
+        if time.time() - timestamp >= self.TTL_SECONDS:
+            self._remove(path)
+            return None
+        
+        return info
+    
+    def set(self, url: str, info: VideoInfo):
+        """Store info for URL."""
+        try:
+            path = self._path_for(url)
+            self._remove(path)  # Replacing an entry; drop its size from the total
+            data = {'timestamp': time.time(), 'info': info.to_dict()}
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            self._total_size += path.stat().st_size
+            if self._total_size > self.SIZE_LIMIT:
+                self._prune()
+        except Exception as e:
+            self.logger.error(f"Error writing info cache: {e}")
+    
+    def clear(self):
+        """Remove all cached entries."""
+        for path in self._cache_dir.iterdir():
+            if path.is_file():
+                path.unlink(missing_ok=True)
+        self._total_size = 0
+        self.logger.info("Video info cache cleared")
+    
+    def _remove(self, path: Path):
+        """Delete an entry if present and keep the size total in step."""
+        try:
+            size = path.stat().st_size
+        except OSError:
+            return
+        path.unlink(missing_ok=True)
+        self._total_size -= size
+    
+    def _prune(self):
+        """Delete oldest entries until the cache is back under PRUNE_TARGET.
+        
+        Only called once the running total goes over SIZE_LIMIT.
+        """
+        files = [(f, f.stat()) for f in self._cache_dir.iterdir() if f.is_file()]
+        total = sum(st.st_size for _, st in files)
+        
+        for f, st in sorted(files, key=lambda entry: entry[1].st_mtime):
+            if total <= self.PRUNE_TARGET:
+                break
+            f.unlink(missing_ok=True)
+            total -= st.st_size
+        self._total_size = total
+
+
+# Singleton instance
+_info_cache: Optional[InfoCache] = None
+
+
+def get_info_cache() -> InfoCache:
+    """Get the singleton info cache instance."""
+    global _info_cache
+    if _info_cache is None:
+        _info_cache = InfoCache()
+    return _info_cache
@@ -61,6 +61,14 @@ class QueueItem:
         return cls(**data)
 
 
+@dataclass
+class QueuedRef:
+    """Lightweight reference to an item just added to the queue (UI notification payload)."""
+    __slots__ = ('title', 'url')
+    title: str
+    url: str
+
+
 class QueueSignals(QObject):
     """Qt signals for queue operations."""
     item_added = Signal(QueueItem)
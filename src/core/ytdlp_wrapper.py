@@ -7,7 +7,7 @@ import json
 import re
 import subprocess
 import threading
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict, fields
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Any
 from PySide6.QtCore import QObject, Signal
@@ -49,6 +49,21 @@ class VideoFormat:
         return " | ".join(parts)
 
 
+def _format_upload_date(upload_date: str) -> str:
+    """Format a yt-dlp YYYYMMDD date for display."""
+    if not upload_date:
+        return "-"
+    return f"{upload_date[:4]}-{upload_date[4:6]}-{upload_date[6:]}"
+
+
+def _format_view_count(view_count: int) -> str:
+    """Format a view count for display."""
+    if view_count <= 0:
+        return "-"
+    views = f"{view_count:,}" if view_count < 1000000 else f"{view_count/1000000:.1f}M"
+    return f"{views} views"
+
+
 @dataclass
 class VideoInfo:
     """Represents video metadata."""
@@ -63,6 +78,10 @@ class VideoInfo:
     view_count: int = 0
     formats: List[VideoFormat] = field(default_factory=list)
     chapters: List[Dict] = field(default_factory=list)
+    requested_url: str = ""  # URL passed to extract_info, before yt-dlp normalizes it
+    # Preformatted for the preview (computed once, off the UI thread)
+    upload_date_display: str = "-"
+    view_count_display: str = "-"
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'VideoInfo':
@@ -80,6 +99,9 @@ class VideoInfo:
                 tbr=fmt.get('tbr')
             ))
         
+        upload_date = data.get('upload_date', '')
+        view_count = int(data.get('view_count', 0))
+        
         return cls(
             id=data.get('id', ''),
             title=data.get('title', 'Unknown'),
@@ -87,12 +109,27 @@ class VideoInfo:
             thumbnail=data.get('thumbnail', ''),
             duration=int(data.get('duration', 0)),
             channel=data.get('channel', data.get('uploader', '')),
-            upload_date=data.get('upload_date', ''),
+            upload_date=upload_date,
             description=data.get('description', ''),
-            view_count=int(data.get('view_count', 0)),
+            view_count=view_count,
             formats=formats,
-            chapters=data.get('chapters', [])
+            chapters=data.get('chapters', []),
+            upload_date_display=_format_upload_date(upload_date),
+            view_count_display=_format_view_count(view_count)
         )
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+    
+    @classmethod
+    def from_stored_dict(cls, data: Dict) -> 'VideoInfo':
+        """Create VideoInfo from a dictionary produced by to_dict()."""
+        # Ignore keys from other app versions so old cache entries still load
+        known = {f.name for f in fields(cls)}
+        data = {key: value for key, value in data.items() if key in known}
+        data['formats'] = [VideoFormat(**fmt) for fmt in data.get('formats', [])]
+        return cls(**data)
 
 
 @dataclass
@@ -113,7 +150,7 @@ class YTDLPSignals(QObject):
     progress = Signal(DownloadProgress)
     finished = Signal(bool, str)  # success, message/filepath
     info_ready = Signal(VideoInfo)
-    error = Signal(str)
+    error = Signal(str, str)  # requested URL, message
 
 
 class YTDLPWrapper:
@@ -163,6 +200,9 @@ class YTDLPWrapper:
     
     def check_available(self) -> bool:
         """Check if yt-dlp is available."""
+        if self.ytdlp_path is None:
+            # Not found earlier; it may have been added since
+            self.ytdlp_path = get_ytdlp_path()
         return self.ytdlp_path is not None and self.ytdlp_path.exists()
     
     def get_version(self) -> Optional[str]:
@@ -185,7 +225,7 @@ class YTDLPWrapper:
     def extract_info(self, url: str, callback: Optional[Callable] = None) -> Optional[VideoInfo]:
         """Extract video information from URL."""
         if not self.check_available():
-            self.signals.error.emit("yt-dlp not found")
+            self.signals.error.emit(url, "yt-dlp not found")
             return None
         
         def _extract():
@@ -210,11 +250,12 @@ class YTDLPWrapper:
                 if result.returncode != 0:
                     error_msg = result.stderr.strip() or "Unknown error"
                     self.logger.error(f"Extract info failed: {error_msg}")
-                    self.signals.error.emit(error_msg)
+                    self.signals.error.emit(url, error_msg)
                     return
                 
                 data = json.loads(result.stdout)
                 info = VideoInfo.from_dict(data)
+                info.requested_url = url
                 self.logger.info(f"Extracted info: {info.title}")
                 self.signals.info_ready.emit(info)
                 
@@ -223,10 +264,10 @@ class YTDLPWrapper:
                     
             except json.JSONDecodeError as e:
                 self.logger.error(f"JSON parse error: {e}")
-                self.signals.error.emit(f"Failed to parse video info: {e}")
+                self.signals.error.emit(url, f"Failed to parse video info: {e}")
             except Exception as e:
                 self.logger.error(f"Extract info error: {e}")
-                self.signals.error.emit(str(e))
+                self.signals.error.emit(url, str(e))
         
         thread = threading.Thread(target=_extract, daemon=True)
         thread.start()
@@ -242,7 +283,7 @@ class YTDLPWrapper:
     ):
         """Start download with progress tracking."""
         if not self.check_available():
-            self.signals.error.emit("yt-dlp not found")
+            self.signals.error.emit(url, "yt-dlp not found")
             return
         
         options = options or {}
@@ -363,7 +404,7 @@ class YTDLPWrapper:
                 
             except Exception as e:
                 self.logger.error(f"Download error: {e}")
-                self.signals.error.emit(str(e))
+                self.signals.error.emit(url, str(e))
                 self.signals.finished.emit(False, str(e))
             finally:
                 self._active_processes.pop(task_id, None)
@@ -16,7 +16,7 @@ from PySide6.QtCore import Qt, Signal
 
 from .preview_widget import PreviewWidget
 from ..core.ytdlp_wrapper import YTDLPWrapper, VideoInfo, DownloadProgress
-from ..core.queue_manager import get_queue_manager
+from ..core.queue_manager import QueuedRef, get_queue_manager
 from ..core.config import get_config
 from ..utils.logger import get_logger
 from ..utils.helpers import format_duration
@@ -26,7 +26,7 @@ class AdvancedMode(QWidget):
     """Advanced mode interface with full feature access."""
     
     download_started = Signal()
-    add_to_queue = Signal(dict)
+    add_to_queue = Signal(object)  # QueuedRef
     switch_to_normal = Signal()
     
     def __init__(self, ytdlp: YTDLPWrapper = None, parent=None):
@@ -37,6 +37,7 @@ class AdvancedMode(QWidget):
         self._current_info: Optional[VideoInfo] = None
         self._is_downloading = False
         self._current_task_id: Optional[str] = None
+        self._pending_url: Optional[str] = None  # URL of the fetch we're waiting on
         self._updating_slider = False  # Flag to prevent slider↔text loop
         self._updating_text = False    # Flag to prevent text↔slider loop
         
@@ -467,9 +468,15 @@ class AdvancedMode(QWidget):
         self.download_btn.setEnabled(False)
         self.queue_btn.setEnabled(False)
         
+        self._pending_url = url
         self.ytdlp.extract_info(url)
     
     def _on_info_ready(self, info: VideoInfo):
+        # The wrapper is shared; ignore results for fetches started elsewhere
+        if info.requested_url != self._pending_url:
+            return
+        
+        self._pending_url = None
         self._current_info = info
         self.preview.set_video_info(info)
         
@@ -482,7 +489,11 @@ class AdvancedMode(QWidget):
         if info.duration > 0:
             self.end_label.setText(self._format_time(info.duration))
     
-    def _on_error(self, error: str):
+    def _on_error(self, url: str, error: str):
+        if url != self._pending_url:
+            return
+        
+        self._pending_url = None
         self.fetch_btn.setEnabled(True)
         self.fetch_btn.setText("Fetch Info")
         QMessageBox.warning(self, "Error", f"Failed to fetch video info:\n{error}")
@@ -633,7 +644,7 @@ class AdvancedMode(QWidget):
             options=self._build_options()
         )
         
-        self.add_to_queue.emit({'title': self._current_info.title})
+        self.add_to_queue.emit(QueuedRef(title=self._current_info.title, url=self._current_info.url))
         QMessageBox.information(self, "Added", f"Added to queue: {self._current_info.title}")
     
     def set_url(self, url: str):
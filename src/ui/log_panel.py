@@ -19,6 +19,14 @@ from ..utils.logger import get_logger, LogSignalEmitter
 class LogPanel(QWidget):
     """Panel for displaying application logs."""
     
+    LEVEL_COLORS = {
+        'DEBUG': '#6a6a8a',
+        'INFO': '#4ecdc4',
+        'WARNING': '#f9ca24',
+        'ERROR': '#ff6b6b',
+        'CRITICAL': '#ff0000'
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = get_logger()
@@ -84,7 +92,8 @@ class LogPanel(QWidget):
         """Connect signals."""
         # Logger signals
         emitter = self.logger.get_signal_emitter()
-        emitter.log_message.connect(self._on_log_message)
+        emitter.log_batch.connect(self._on_log_batch)
+        emitter.records_dropped.connect(self._on_records_dropped)
         
         # UI signals
         self.filter_combo.currentTextChanged.connect(self._on_filter_changed)
@@ -92,33 +101,41 @@ class LogPanel(QWidget):
         self.clear_btn.clicked.connect(self._clear_log)
         self.export_btn.clicked.connect(self._export_log)
     
-    @Slot(str, str, str)
-    def _on_log_message(self, level: str, timestamp: str, message: str):
-        """Handle incoming log message."""
-        # Check filter
-        if self._filter_level != "ALL" and self._filter_level != level:
-            return
-        
-        # Format colors
-        colors = {
-            'DEBUG': '#6a6a8a',
-            'INFO': '#4ecdc4',
-            'WARNING': '#f9ca24',
-            'ERROR': '#ff6b6b',
-            'CRITICAL': '#ff0000'
-        }
-        
-        color = colors.get(level, '#a0a0c0')
+    @Slot(list)
+    def _on_log_batch(self, batch: list):
+        """Handle a batch of (level, timestamp, message) records."""
+        lines = [
+            self._format_message(level, timestamp, message)
+            for level, timestamp, message in batch
+            if self._passes_filter(level)
+        ]
+        if lines:
+            # One insert per batch so the document lays out once
+            self.log_text.append('<br>'.join(lines))
+            self._scroll_to_end()
+    
+    @Slot(int)
+    def _on_records_dropped(self, count: int):
+        """Note that the logger discarded records while the GUI was busy."""
+        self.log_text.append(
+            f'<span style="color: #f9ca24;">... {count} log lines dropped</span>'
+        )
+    
+    def _passes_filter(self, level: str) -> bool:
+        """Check a level against the current filter."""
+        return self._filter_level == "ALL" or self._filter_level == level
+    
+    def _format_message(self, level: str, timestamp: str, message: str) -> str:
+        """Build the HTML line for one message."""
+        color = self.LEVEL_COLORS.get(level, '#a0a0c0')
         
-        # Format message
         formatted = f'<span style="color: {color};">[{level}]</span> '
         formatted += f'<span style="color: #6a6a8a;">{timestamp}</span> | '
         formatted += f'<span style="color: #eaeaea;">{message}</span>'
-        
-        # Append to log
-        self.log_text.append(formatted)
-        
-        # Auto-scroll
+        return formatted
+    
+    def _scroll_to_end(self):
+        """Move the cursor to the end if auto-scroll is on."""
         if self._auto_scroll:
             cursor = self.log_text.textCursor()
             cursor.movePosition(QTextCursor.End)
@@ -154,4 +171,4 @@ class LogPanel(QWidget):
     def add_message(self, level: str, message: str):
         """Add a log message programmatically."""
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        self._on_log_message(level, timestamp, message)
+        self._on_log_batch([(level, timestamp, message)])
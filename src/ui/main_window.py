@@ -13,13 +13,16 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QAction, QIcon
 
-from .styles import get_theme
+from .styles import apply_theme
 from .normal_mode import NormalMode
 from .advanced_mode import AdvancedMode
 from .queue_panel import QueuePanel
 from .log_panel import LogPanel
+from .preview_widget import clear_thumbnail_cache
 from ..core.config import get_config
 from ..core.ytdlp_wrapper import YTDLPWrapper
+from ..core.queue_manager import QueuedRef
+from ..core.info_cache import get_info_cache
 from ..core.downloader import get_download_manager
 from ..utils.logger import get_logger
 
@@ -52,8 +55,7 @@ class MainWindow(QMainWindow):
         self._set_window_icon()
         
         # Apply theme
-        theme = get_theme(self.config.settings.ui.theme)
-        self.setStyleSheet(theme)
+        apply_theme(self, self.config.settings.ui.theme)
         
         # Restore window geometry
         ui = self.config.settings.ui
@@ -170,6 +172,10 @@ class MainWindow(QMainWindow):
         import_action.triggered.connect(self.queue_panel._import_urls)
         file_menu.addAction(import_action)
         
+        clear_cache_action = QAction("🗑 Clear Cache", self)
+        clear_cache_action.triggered.connect(self._clear_cache)
+        file_menu.addAction(clear_cache_action)
+        
         file_menu.addSeparator()
         
         exit_action = QAction("Exit", self)
@@ -387,15 +393,22 @@ class MainWindow(QMainWindow):
     
     def _set_theme(self, theme_name: str):
         """Set application theme."""
-        self.setStyleSheet(get_theme(theme_name))
+        apply_theme(self, theme_name)
         self.config.settings.ui.theme = theme_name
         self.config.save()
         mode = "Night Mode" if theme_name == "dark" else "Day Mode"
         self.logger.info(f"Theme changed to {mode}")
     
-    def _on_queue_add(self, info: dict):
+    def _clear_cache(self):
+        """Clear cached video info and thumbnails."""
+        get_info_cache().clear()
+        clear_thumbnail_cache()
+        self.stats_label.setText("Cache cleared")
+        QTimer.singleShot(3000, lambda: self.stats_label.setText("Ready"))
+    
+    def _on_queue_add(self, ref: QueuedRef):
         """Handle item added to queue."""
-        self.stats_label.setText(f"Added: {info.get('title', 'item')[:40]}")
+        self.stats_label.setText(f"Added: {(ref.title or 'item')[:40]}")
         QTimer.singleShot(3000, lambda: self.stats_label.setText("Ready"))
     
     def _on_download_started(self, item_id: str):
@@ -10,20 +10,76 @@ from PySide6.QtWidgets import (
     QPushButton, QComboBox, QGroupBox, QFileDialog,
     QProgressBar, QMessageBox, QApplication
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 
 from .preview_widget import PreviewWidget
 from ..core.ytdlp_wrapper import YTDLPWrapper, VideoInfo, DownloadProgress
-from ..core.queue_manager import get_queue_manager
+from ..core.queue_manager import QueuedRef, get_queue_manager
+from ..core.info_cache import get_info_cache
 from ..core.config import get_config
 from ..utils.logger import get_logger
+from ..utils.helpers import is_valid_url
+
+
+# Combo box entries (indices are used by _build_format_spec / _get_extra_args)
+_FORMAT_ITEMS = (
+    "Video + Audio (MP4)",
+    "Video Only",
+    "Audio Only (MP3)",
+    "Audio Only (M4A)",
+)
+
+_QUALITY_ITEMS = (
+    "Best Available",
+    "1080p (Full HD)",
+    "720p (HD)",
+    "480p (SD)",
+    "360p (Low)",
+)
+
+# Max video height per quality index (None = best available)
+_QUALITY_HEIGHTS = (None, 1080, 720, 480, 360)
+
+
+def _spec_for(format_idx: int, height: Optional[int]) -> str:
+    """Build yt-dlp format specification for a format index and max height."""
+    if format_idx == 0:  # Video + Audio (MP4)
+        if height:
+            return f"bestvideo[height<={height}]+bestaudio/best"
+        return "bestvideo+bestaudio/best"
+    elif format_idx == 1:  # Video Only
+        if height:
+            return f"bestvideo[height<={height}]/best"
+        return "bestvideo/best"
+    elif format_idx == 2:  # Audio MP3
+        return "bestaudio/best"
+    elif format_idx == 3:  # Audio M4A
+        return "bestaudio[ext=m4a]/bestaudio/best"
+    
+    return "bestvideo+bestaudio/best"
+
+
+# Format spec for every (format index, quality index) combo, built once
+_FORMAT_SPECS = {
+    (format_idx, quality_idx): _spec_for(format_idx, height)
+    for format_idx in range(len(_FORMAT_ITEMS))
+    for quality_idx, height in enumerate(_QUALITY_HEIGHTS)
+}
+
+# Extra yt-dlp arguments per format index
+_EXTRA_ARGS = (
+    (),  # Video + Audio (MP4)
+    (),  # Video Only
+    ("--extract-audio", "--audio-format", "mp3"),  # Audio MP3
+    ("--extract-audio", "--audio-format", "m4a"),  # Audio M4A
+)
 
 
 class NormalMode(QWidget):
     """Normal mode interface for simple downloads."""
     
     download_started = Signal()
-    add_to_queue = Signal(dict)
+    add_to_queue = Signal(object)  # QueuedRef
     switch_to_advanced = Signal(str)  # Emit URL when switching
     
     def __init__(self, ytdlp: YTDLPWrapper = None, parent=None):
@@ -31,9 +87,26 @@ class NormalMode(QWidget):
         self.logger = get_logger()
         self.config = get_config()
         self.ytdlp = ytdlp or YTDLPWrapper()
+        self._queue = get_queue_manager()
+        self._info_cache = get_info_cache()
         self._current_info: Optional[VideoInfo] = None
         self._is_downloading = False
         self._current_task_id: Optional[str] = None
+        self._pending_url: Optional[str] = None  # URL of the fetch we're waiting on
+        self._inflight: set = set()  # URLs with an extract_info call still running
+        # Last values shown in the progress labels, to skip redundant setText calls
+        self._last_speed: Optional[str] = None
+        self._last_eta: Optional[str] = None
+        self._last_status: Optional[str] = None
+        
+        # Progress updates are coalesced and applied at most every 100 ms
+        self._pending_progress: Optional[DownloadProgress] = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        
+        self._clipboard = QApplication.clipboard()
         
         self._setup_ui()
         self._connect_signals()
@@ -81,12 +154,7 @@ class NormalMode(QWidget):
         format_row.addWidget(QLabel("Format:"))
         
         self.format_combo = QComboBox()
-        self.format_combo.addItems([
-            "Video + Audio (MP4)",
-            "Video Only",
-            "Audio Only (MP3)",
-            "Audio Only (M4A)"
-        ])
+        self.format_combo.addItems(list(_FORMAT_ITEMS))
         self.format_combo.setMinimumWidth(180)
         format_row.addWidget(self.format_combo)
         
@@ -94,13 +162,7 @@ class NormalMode(QWidget):
         format_row.addWidget(QLabel("Quality:"))
         
         self.quality_combo = QComboBox()
-        self.quality_combo.addItems([
-            "Best Available",
-            "1080p (Full HD)",
-            "720p (HD)",
-            "480p (SD)",
-            "360p (Low)"
-        ])
+        self.quality_combo.addItems(list(_QUALITY_ITEMS))
         self.quality_combo.setMinimumWidth(150)
         format_row.addWidget(self.quality_combo)
         
@@ -122,7 +184,42 @@ class NormalMode(QWidget):
         options_layout.addLayout(folder_row)
         layout.addWidget(options_group)
         
-        # Progress Section
+        # Progress Section (built on first download, see _build_progress_group)
+        self._main_layout = layout
+        self._progress_index = layout.count()
+        self.progress_group: Optional[QGroupBox] = None
+        
+        # Action Buttons
+        action_layout = QHBoxLayout()
+        
+        self.download_btn = QPushButton("▶ Download")
+        self.download_btn.setObjectName("primaryButton")
+        self.download_btn.setEnabled(False)
+        self.download_btn.setMinimumWidth(130)
+        action_layout.addWidget(self.download_btn)
+        
+        self.queue_btn = QPushButton("+ Add to Queue")
+        self.queue_btn.setObjectName("secondaryButton")
+        self.queue_btn.setEnabled(False)
+        self.queue_btn.setMinimumWidth(130)
+        action_layout.addWidget(self.queue_btn)
+        
+        self.clear_btn = QPushButton("🗑 Clear")
+        self.clear_btn.setMinimumWidth(100)
+        action_layout.addWidget(self.clear_btn)
+        
+        self.advanced_btn = QPushButton("⚙ Advanced")
+        self.advanced_btn.setMinimumWidth(120)
+        action_layout.addWidget(self.advanced_btn)
+        
+        layout.addLayout(action_layout)
+        layout.addStretch()
+    
+    def _build_progress_group(self):
+        """Create the download progress section on first use."""
+        if self.progress_group is not None:
+            return
+        
         self.progress_group = QGroupBox("Download Progress")
         progress_layout = QVBoxLayout(self.progress_group)
         
@@ -151,35 +248,10 @@ class NormalMode(QWidget):
         self.cancel_btn.setObjectName("dangerButton")
         self.cancel_btn.setVisible(False)
         progress_layout.addWidget(self.cancel_btn, alignment=Qt.AlignCenter)
+        self.cancel_btn.clicked.connect(self._cancel_download)
         
         self.progress_group.setVisible(False)
-        layout.addWidget(self.progress_group)
-        
-        # Action Buttons
-        action_layout = QHBoxLayout()
-        
-        self.download_btn = QPushButton("▶ Download")
-        self.download_btn.setObjectName("primaryButton")
-        self.download_btn.setEnabled(False)
-        self.download_btn.setMinimumWidth(130)
-        action_layout.addWidget(self.download_btn)
-        
-        self.queue_btn = QPushButton("+ Add to Queue")
-        self.queue_btn.setObjectName("secondaryButton")
-        self.queue_btn.setEnabled(False)
-        self.queue_btn.setMinimumWidth(130)
-        action_layout.addWidget(self.queue_btn)
-        
-        self.clear_btn = QPushButton("🗑 Clear")
-        self.clear_btn.setMinimumWidth(100)
-        action_layout.addWidget(self.clear_btn)
-        
-        self.advanced_btn = QPushButton("⚙ Advanced")
-        self.advanced_btn.setMinimumWidth(120)
-        action_layout.addWidget(self.advanced_btn)
-        
-        layout.addLayout(action_layout)
-        layout.addStretch()
+        self._main_layout.insertWidget(self._progress_index, self.progress_group)
     
     def _connect_signals(self):
         """Connect UI signals."""
@@ -191,27 +263,31 @@ class NormalMode(QWidget):
         self.clear_btn.clicked.connect(self._clear_all)
         self.advanced_btn.clicked.connect(lambda: self.switch_to_advanced.emit(self.url_input.text()))
         self.url_input.returnPressed.connect(self._fetch_info)
+        # Prefetch once the user is done with the field (pasting fetches right away)
+        self.url_input.editingFinished.connect(self._maybe_prefetch)
         self.format_combo.currentIndexChanged.connect(self._on_format_changed)
-        self.cancel_btn.clicked.connect(self._cancel_download)
         
-        # YT-DLP signals
-        self.ytdlp.signals.info_ready.connect(self._on_info_ready)
-        self.ytdlp.signals.error.connect(self._on_error)
-        self.ytdlp.signals.progress.connect(self._on_progress)
-        self.ytdlp.signals.finished.connect(self._on_finished)
+        # YT-DLP signals (always queued so worker emissions go through the event loop)
+        self.ytdlp.signals.info_ready.connect(self._on_info_ready, Qt.QueuedConnection)
+        self.ytdlp.signals.error.connect(self._on_error, Qt.QueuedConnection)
+        self.ytdlp.signals.progress.connect(self._on_progress, Qt.QueuedConnection)
+        self.ytdlp.signals.finished.connect(self._on_finished, Qt.QueuedConnection)
     
     def _clear_all(self):
         """Clear all fields and reset UI."""
         self.url_input.clear()
         self.preview.clear()
         self._current_info = None
+        self._pending_url = None
         self.download_btn.setEnabled(False)
         self.queue_btn.setEnabled(False)
-        self.progress_group.setVisible(False)
-        self.progress_bar.setValue(0)
-        self.speed_label.setText("Speed: -")
-        self.eta_label.setText("ETA: -")
-        self.status_label.setText("Status: Ready")
+        if self.progress_group is not None:
+            self.progress_group.setVisible(False)
+            self.progress_bar.setValue(0)
+            self.speed_label.setText("Speed: -")
+            self.eta_label.setText("ETA: -")
+            self.status_label.setText("Status: Ready")
+        self._last_speed = self._last_eta = self._last_status = None
         self.format_combo.setCurrentIndex(0)
         self.quality_combo.setCurrentIndex(0)
         self.quality_combo.setEnabled(True)
@@ -219,11 +295,19 @@ class NormalMode(QWidget):
     
     def _paste_url(self):
         """Paste URL from clipboard."""
-        clipboard = QApplication.clipboard()
-        text = clipboard.text()
-        if text:
-            self.url_input.setText(text.strip())
-            self._fetch_info()
+        text = self._clipboard.text().strip()
+        if not text:
+            return
+        
+        # Same URL already loaded or loading; nothing to refetch
+        if text == self.url_input.text().strip() and (self._current_info or self._pending_url):
+            return
+        
+        # Block textChanged so listeners don't react to a value we fetch right away
+        self.url_input.blockSignals(True)
+        self.url_input.setText(text)
+        self.url_input.blockSignals(False)
+        self._fetch_info()
     
     def _fetch_info(self):
         """Fetch video information."""
@@ -238,10 +322,49 @@ class NormalMode(QWidget):
         self.download_btn.setEnabled(False)
         self.queue_btn.setEnabled(False)
         
+        # Serve repeat fetches from the cache without running yt-dlp
+        cached = self._info_cache.get(url)
+        if cached:
+            self._pending_url = None
+            self._show_info(cached)
+            return
+        
+        self._pending_url = url
+        
+        # Already extracting this URL; its result will be shown when it arrives
+        if url in self._inflight:
+            return
+        
+        self._inflight.add(url)
+        self.ytdlp.extract_info(url)
+    
+    def _maybe_prefetch(self):
+        """Silently start extracting the typed URL so Fetch can show it at once."""
+        url = self.url_input.text().strip()
+        if not url or not is_valid_url(url):
+            return
+        if url in self._inflight or self._info_cache.get(url):
+            return
+        
+        self.logger.debug(f"Prefetching info: {url}")
+        self._inflight.add(url)
         self.ytdlp.extract_info(url)
     
     def _on_info_ready(self, info: VideoInfo):
         """Handle received video info."""
+        if info.requested_url:
+            self._inflight.discard(info.requested_url)
+            self._info_cache.set(info.requested_url, info)
+        
+        # Drop results for fetches that were superseded or not started here
+        if info.requested_url != self._pending_url:
+            return
+        
+        self._pending_url = None
+        self._show_info(info)
+    
+    def _show_info(self, info: VideoInfo):
+        """Display loaded video info and enable download actions."""
         self._current_info = info
         self.preview.set_video_info(info)
         
@@ -252,12 +375,20 @@ class NormalMode(QWidget):
         
         self.logger.info(f"Video info loaded: {info.title}")
     
-    def _on_error(self, error: str):
+    def _on_error(self, url: str, error: str):
         """Handle error."""
+        self._inflight.discard(url)
+        
+        # Not the fetch the user is waiting on (e.g. a failed prefetch); stay quiet
+        if url != self._pending_url:
+            self.logger.debug(f"Background fetch error for {url}: {error}")
+            return
+        
+        self._pending_url = None
         self.fetch_btn.setEnabled(True)
         self.fetch_btn.setText("🔍 Fetch")
         
-        QMessageBox.warning(self, "Error", f"Failed to fetch video info:\n{error}")
+        self._show_message(QMessageBox.Warning, "Error", f"Failed to fetch video info:\n{error}")
         self.logger.error(f"Fetch error: {error}")
     
     def _browse_folder(self):
@@ -271,7 +402,9 @@ class NormalMode(QWidget):
             self.output_input.setText(folder)
             self.config.settings.download.output_path = folder
             self.config.settings.add_recent_folder(folder)
-            self.config.save()
+            # Defer the write so the dialog returns without touching disk
+            self.config.mark_dirty()
+            QTimer.singleShot(2000, self.config.save_if_dirty)
     
     def _on_format_changed(self, index: int):
         """Handle format selection change."""
@@ -281,45 +414,30 @@ class NormalMode(QWidget):
     
     def _build_format_spec(self) -> str:
         """Build yt-dlp format specification."""
-        format_idx = self.format_combo.currentIndex()
-        quality_idx = self.quality_combo.currentIndex()
-        
-        # Quality mapping
-        quality_heights = {
-            0: None,     # Best
-            1: 1080,
-            2: 720,
-            3: 480,
-            4: 360
-        }
-        
-        height = quality_heights.get(quality_idx)
-        
-        if format_idx == 0:  # Video + Audio (MP4)
-            if height:
-                return f"bestvideo[height<={height}]+bestaudio/best"
-            return "bestvideo+bestaudio/best"
-        elif format_idx == 1:  # Video Only
-            if height:
-                return f"bestvideo[height<={height}]/best"
-            return "bestvideo/best"
-        elif format_idx == 2:  # Audio MP3
-            return "bestaudio/best"
-        elif format_idx == 3:  # Audio M4A
-            return "bestaudio[ext=m4a]/bestaudio/best"
-        
-        return "bestvideo+bestaudio/best"
+        key = (self.format_combo.currentIndex(), self.quality_combo.currentIndex())
+        return _FORMAT_SPECS.get(key, "bestvideo+bestaudio/best")
     
     def _get_extra_args(self) -> list:
         """Get extra yt-dlp arguments based on format."""
         format_idx = self.format_combo.currentIndex()
+        if 0 <= format_idx < len(_EXTRA_ARGS):
+            return list(_EXTRA_ARGS[format_idx])
+        return []
+    
+    def _build_options(self) -> dict:
+        """Build download options from the current settings and format choice."""
+        download_settings = self.config.settings.download
+        options = {
+            'embed_thumbnail': download_settings.embed_thumbnail,
+            'embed_metadata': download_settings.embed_metadata,
+            'extra_args': self._get_extra_args(),
+        }
         
-        if format_idx == 2:  # Audio MP3
-            return ["--extract-audio", "--audio-format", "mp3"]
-        elif format_idx == 3:  # Audio M4A
-            return ["--extract-audio", "--audio-format", "m4a"]
+        # Force MP4 container for video
+        if self.format_combo.currentIndex() <= 1:
+            options['merge_output_format'] = 'mp4'
         
-        return []
+        return options
     
     def _start_download(self):
         """Start immediate download."""
@@ -332,30 +450,20 @@ class NormalMode(QWidget):
         
         self._is_downloading = True
         self._current_task_id = self._current_info.id
+        self._build_progress_group()
         self.progress_group.setVisible(True)
         self.progress_bar.setValue(0)
         self.status_label.setText("Status: Starting...")
         self.speed_label.setText("Speed: -")
         self.eta_label.setText("ETA: -")
+        self._last_speed = self._last_eta = self._last_status = None
         self.download_btn.setEnabled(False)
         self.queue_btn.setEnabled(False)
         self.cancel_btn.setVisible(True)
         
         format_spec = self._build_format_spec()
-        extra_args = self._get_extra_args()
         output_path = self.output_input.text()
-        
-        # Determine if video (needs merge format)
-        format_idx = self.format_combo.currentIndex()
-        is_video = format_idx <= 1
-        
-        options = {
-            'extra_args': extra_args,
-        }
-        
-        # Force MP4 container for video
-        if is_video:
-            options['merge_output_format'] = 'mp4'
+        options = self._build_options()
         
         self.logger.info(f"Starting download: {self._current_info.title}")
         self.logger.debug(f"Format spec: {format_spec}")
@@ -382,20 +490,49 @@ class NormalMode(QWidget):
         """Reset UI after download completes or cancels."""
         self._is_downloading = False
         self._current_task_id = None
+        self._progress_timer.stop()
+        self._pending_progress = None
         self.download_btn.setEnabled(True)
         self.queue_btn.setEnabled(True)
         self.cancel_btn.setVisible(False)
     
     def _on_progress(self, progress: DownloadProgress):
-        """Update download progress."""
+        """Queue a progress update; bursts are collapsed into one repaint."""
         if not self._is_downloading:
             return
-        self.progress_bar.setValue(int(progress.percent))
-        if progress.speed:
-            self.speed_label.setText(f"Speed: {progress.speed}")
-        if progress.eta:
-            self.eta_label.setText(f"ETA: {progress.eta}")
-        self.status_label.setText(f"Status: {progress.status.title()}")
+        
+        self._pending_progress = progress
+        if progress.percent >= 100:
+            # Always show completion immediately
+            self._progress_timer.stop()
+            self._flush_progress()
+        elif not self._progress_timer.isActive():
+            self._progress_timer.start()
+    
+    def _flush_progress(self):
+        """Apply the latest queued progress update to the widgets."""
+        progress = self._pending_progress
+        self._pending_progress = None
+        if progress is None or not self._is_downloading:
+            return
+        
+        # Suspend painting so the bar and labels repaint once together
+        self.progress_group.setUpdatesEnabled(False)
+        try:
+            percent = int(progress.percent)
+            if percent != self.progress_bar.value():
+                self.progress_bar.setValue(percent)
+            if progress.speed and progress.speed != self._last_speed:
+                self.speed_label.setText("Speed: " + progress.speed)
+                self._last_speed = progress.speed
+            if progress.eta and progress.eta != self._last_eta:
+                self.eta_label.setText("ETA: " + progress.eta)
+                self._last_eta = progress.eta
+            if progress.status != self._last_status:
+                self.status_label.setText("Status: " + progress.status.title())
+                self._last_status = progress.status
+        finally:
+            self.progress_group.setUpdatesEnabled(True)
     
     def _on_finished(self, success: bool, message: str):
         """Handle download completion."""
@@ -408,31 +545,30 @@ class NormalMode(QWidget):
             self.status_label.setText("Status: Complete!")
             self.progress_bar.setValue(100)
             self.logger.info(f"Download completed: {message}")
-            QMessageBox.information(self, "Success", "Download completed successfully!")
+            self._show_message(QMessageBox.Information, "Success", "Download completed successfully!")
         else:
             self.status_label.setText("Status: Failed")
             self.logger.error(f"Download failed: {message}")
-            QMessageBox.warning(self, "Download Failed", f"Download failed:\n{message}")
+            self._show_message(QMessageBox.Warning, "Download Failed", f"Download failed:\n{message}")
+    
+    def _show_message(self, icon: QMessageBox.Icon, title: str, text: str):
+        """Show a non-modal message box that doesn't block the event loop."""
+        box = QMessageBox(self)
+        box.setIcon(icon)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.open()
     
     def _add_to_queue(self):
         """Add current video to download queue."""
         if not self._current_info:
             return
         
-        queue = get_queue_manager()
         format_spec = self._build_format_spec()
+        options = self._build_options()
         
-        format_idx = self.format_combo.currentIndex()
-        is_video = format_idx <= 1
-        
-        options = {
-            'extra_args': self._get_extra_args(),
-        }
-        
-        if is_video:
-            options['merge_output_format'] = 'mp4'
-        
-        queue.add_url(
+        self._queue.add_url(
             url=self._current_info.url,
             title=self._current_info.title,
             thumbnail=self._current_info.thumbnail,
@@ -442,15 +578,19 @@ class NormalMode(QWidget):
             options=options
         )
         
-        self.add_to_queue.emit({'title': self._current_info.title})
+        self.add_to_queue.emit(QueuedRef(title=self._current_info.title, url=self._current_info.url))
         self.logger.info(f"Added to queue: {self._current_info.title}")
         
         QMessageBox.information(self, "Added to Queue", f"'{self._current_info.title}' added to download queue.")
     
     def set_url(self, url: str):
         """Set URL externally (for sync from other modes)."""
-        if url and url != self.url_input.text():
+        url = url.strip()
+        if url and url != self.url_input.text().strip():
+            # Mode sync, not user input; don't let it trigger a prefetch
+            self.url_input.blockSignals(True)
             self.url_input.setText(url)
+            self.url_input.blockSignals(False)
     
     def get_url(self) -> str:
         """Get current URL."""
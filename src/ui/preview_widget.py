@@ -3,45 +3,181 @@ YT-DLP GUI - Preview Widget
 Video thumbnail and metadata preview component.
 """
 
+import hashlib
+import threading
 import requests
-from io import BytesIO
+from requests.adapters import HTTPAdapter
+from pathlib import Path
 from typing import Optional
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QFrame, QSizePolicy
 )
-from PySide6.QtCore import Qt, Signal, QThread
-from PySide6.QtGui import QPixmap, QImage
+from PySide6.QtCore import (
+    Qt, Signal, QObject, QRunnable, QThreadPool,
+    QByteArray, QBuffer, QIODevice
+)
+from PySide6.QtGui import QPixmap, QImage, QPixmapCache
 
+from ..core.config import get_config
 from ..core.ytdlp_wrapper import VideoInfo
 from ..utils.helpers import format_duration, format_size
 
 
-class ThumbnailLoader(QThread):
-    """Background thread for loading thumbnails."""
-    loaded = Signal(QPixmap)
-    error = Signal(str)
+# Shared HTTP session (keep-alive) for all thumbnail requests
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# On-disk thumbnail cache limit; past this size the oldest files are pruned
+# down to _THUMB_PRUNE_TARGET so the next write doesn't prune again
+_THUMB_CACHE_LIMIT = 200 * 1024 * 1024
+_THUMB_PRUNE_TARGET = 150 * 1024 * 1024
+
+# Cache directory (created on first use) and running size of its files;
+# the total is updated from pool threads, so both are guarded by the lock
+_thumbs_dir: Optional[Path] = None
+_thumbs_total = 0
+_thumbs_lock = threading.Lock()
+
+# Thumbnail display size; images are scaled to this on the worker thread
+_THUMB_WIDTH = 240
+_THUMB_HEIGHT = 135
+
+
+def _thumb_cache_key(url: str) -> str:
+    """Get the cache key for a thumbnail URL at the display size."""
+    return f"{url}@{_THUMB_WIDTH}x{_THUMB_HEIGHT}"
+
+
+def _thumbs_directory() -> Path:
+    """Get the thumbnail cache directory, creating and sizing it on first use."""
+    global _thumbs_dir, _thumbs_total
+    if _thumbs_dir is not None:
+        return _thumbs_dir
     
-    def __init__(self, url: str):
+    with _thumbs_lock:
+        if _thumbs_dir is None:
+            thumbs_dir = get_config().cache_dir / "thumbs"
+            thumbs_dir.mkdir(exist_ok=True)
+            _thumbs_total = sum(f.stat().st_size for f in thumbs_dir.iterdir() if f.is_file())
+            _thumbs_dir = thumbs_dir
+    return _thumbs_dir
+
+
+def _thumb_cache_path(url: str) -> Path:
+    """Get the on-disk cache file for a scaled thumbnail."""
+    return _thumbs_directory() / hashlib.sha1(_thumb_cache_key(url).encode('utf-8')).hexdigest()
+
+
+def _add_thumb_size(size: int):
+    """Account for a newly written thumbnail, pruning once the cache is over its limit."""
+    global _thumbs_total
+    with _thumbs_lock:
+        _thumbs_total += size
+        if _thumbs_total > _THUMB_CACHE_LIMIT:
+            _thumbs_total = _prune_thumb_cache(_thumbs_dir)
+
+
+def _prune_thumb_cache(thumbs_dir: Path) -> int:
+    """Delete least recently used thumbnails down to the prune target; returns the new total."""
+    files = [(f, f.stat()) for f in thumbs_dir.iterdir() if f.is_file()]
+    total = sum(st.st_size for _, st in files)
+    
+    for f, st in sorted(files, key=lambda entry: entry[1].st_mtime):
+        if total <= _THUMB_PRUNE_TARGET:
+            break
+        f.unlink(missing_ok=True)
+        total -= st.st_size
+    return total
+
+
+def clear_thumbnail_cache():
+    """Delete all cached thumbnails."""
+    global _thumbs_total
+    thumbs_dir = _thumbs_directory()
+    with _thumbs_lock:
+        for f in thumbs_dir.iterdir():
+            if f.is_file():
+                f.unlink(missing_ok=True)
+        _thumbs_total = 0
+
+
+class ThumbnailSignals(QObject):
+    """Signals for thumbnail loading tasks."""
+    loaded = Signal(int, QImage)  # request id, image
+    error = Signal(int, str)  # request id, message
+
+
+class ThumbnailTask(QRunnable):
+    """Thread pool task that loads a thumbnail from cache or network."""
+    
+    def __init__(self, url: str, req_id: int, cancelled: threading.Event):
         super().__init__()
         self.url = url
+        self.req_id = req_id
+        self.cancelled = cancelled
+        self.signals = ThumbnailSignals()
     
     def run(self):
+        # Superseded before the pool got to us; skip the request entirely
+        if self.cancelled.is_set():
+            return
+        
         try:
-            response = requests.get(self.url, timeout=10)
-            response.raise_for_status()
+            cache_path = _thumb_cache_path(self.url)
+            if cache_path.exists():
+                # Cached thumbnails are already scaled to display size
+                image = QImage()
+                image.loadFromData(cache_path.read_bytes())
+                cache_path.touch()  # Mark as recently used
+            else:
+                data = self._fetch()
+                if data is None:
+                    return
+                
+                image = QImage()
+                image.loadFromData(data)
+                if not image.isNull():
+                    # QImage (unlike QPixmap) can be scaled off the GUI thread
+                    image = image.scaled(
+                        _THUMB_WIDTH, _THUMB_HEIGHT,
+                        Qt.KeepAspectRatio,
+                        Qt.SmoothTransformation
+                    )
+                    self._store(cache_path, image)
             
-            image_data = BytesIO(response.content)
-            image = QImage()
-            image.loadFromData(image_data.read())
+            if self.cancelled.is_set():
+                return
             
             if not image.isNull():
-                pixmap = QPixmap.fromImage(image)
-                self.loaded.emit(pixmap)
+                self.signals.loaded.emit(self.req_id, image)
             else:
-                self.error.emit("Failed to load image")
+                self.signals.error.emit(self.req_id, "Failed to load image")
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(self.req_id, str(e))
+    
+    def _fetch(self) -> Optional[bytes]:
+        """Download the thumbnail, returning None if cancelled midway."""
+        chunks = []
+        with _SESSION.get(self.url, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                if self.cancelled.is_set():
+                    return None
+                chunks.append(chunk)
+        return b"".join(chunks)
+    
+    @staticmethod
+    def _store(cache_path: Path, image: QImage):
+        """Write a scaled thumbnail to the disk cache as PNG."""
+        data = QByteArray()
+        buffer = QBuffer(data)
+        buffer.open(QIODevice.WriteOnly)
+        image.save(buffer, "PNG")
+        buffer.close()
+        raw = data.data()
+        cache_path.write_bytes(raw)
+        _add_thumb_size(len(raw))
 
 
 class PreviewWidget(QWidget):
@@ -50,7 +186,9 @@ class PreviewWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._setup_ui()
-        self._thumbnail_loader: Optional[ThumbnailLoader] = None
+        self._req_id = 0  # Increments per thumbnail request; older results are ignored
+        self._thumb_cancel: Optional[threading.Event] = None
+        self._thumb_url = ""  # URL of the thumbnail being loaded
         self._current_info: Optional[VideoInfo] = None
     
     def _setup_ui(self):
@@ -60,7 +198,7 @@ class PreviewWidget(QWidget):
         
         # Thumbnail
         self.thumbnail_frame = QFrame()
-        self.thumbnail_frame.setFixedSize(240, 135)
+        self.thumbnail_frame.setFixedSize(_THUMB_WIDTH, _THUMB_HEIGHT)
         self.thumbnail_frame.setStyleSheet("""
             QFrame {
                 background-color: #0f3460;
@@ -138,17 +276,8 @@ class PreviewWidget(QWidget):
         self.channel_label.setText(info.channel or "Unknown")
         self.duration_label.setText(format_duration(info.duration))
         
-        if info.view_count > 0:
-            views = f"{info.view_count:,}" if info.view_count < 1000000 else f"{info.view_count/1000000:.1f}M"
-            self.views_label.setText(f"{views} views")
-        else:
-            self.views_label.setText("-")
-        
-        if info.upload_date:
-            date = f"{info.upload_date[:4]}-{info.upload_date[4:6]}-{info.upload_date[6:]}"
-            self.date_label.setText(date)
-        else:
-            self.date_label.setText("-")
+        self.views_label.setText(info.view_count_display)
+        self.date_label.setText(info.upload_date_display)
         
         # Load thumbnail
         if info.thumbnail:
@@ -156,32 +285,53 @@ class PreviewWidget(QWidget):
     
     def _load_thumbnail(self, url: str):
         """Load thumbnail from URL in background."""
-        if self._thumbnail_loader and self._thumbnail_loader.isRunning():
-            self._thumbnail_loader.terminate()
-            self._thumbnail_loader.wait()
+        self._cancel_thumbnail()
+        self._req_id += 1
+        self._thumb_url = url
         
+        # Decoded pixmaps stay in memory for instant re-selection
+        pixmap = QPixmapCache.find(_thumb_cache_key(url))
+        if pixmap and not pixmap.isNull():
+            self.thumbnail_label.setPixmap(pixmap)
+            return
+        
+        self._thumb_cancel = threading.Event()
         self.thumbnail_label.setText("Loading...")
         
-        self._thumbnail_loader = ThumbnailLoader(url)
-        self._thumbnail_loader.loaded.connect(self._on_thumbnail_loaded)
-        self._thumbnail_loader.error.connect(self._on_thumbnail_error)
-        self._thumbnail_loader.start()
+        task = ThumbnailTask(url, self._req_id, self._thumb_cancel)
+        task.signals.loaded.connect(self._on_thumbnail_loaded)
+        task.signals.error.connect(self._on_thumbnail_error)
+        QThreadPool.globalInstance().start(task)
+    
+    def _cancel_thumbnail(self):
+        """Ask the in-flight thumbnail task, if any, to stop."""
+        if self._thumb_cancel is not None:
+            self._thumb_cancel.set()
+            self._thumb_cancel = None
     
-    def _on_thumbnail_loaded(self, pixmap: QPixmap):
+    def _on_thumbnail_loaded(self, req_id: int, image: QImage):
         """Handle loaded thumbnail."""
-        scaled = pixmap.scaled(
-            self.thumbnail_frame.size(),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
-        self.thumbnail_label.setPixmap(scaled)
+        if req_id != self._req_id:
+            return
+        
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(_thumb_cache_key(self._thumb_url), pixmap)
+        self.thumbnail_label.setPixmap(pixmap)
     
-    def _on_thumbnail_error(self, error: str):
+    def _on_thumbnail_error(self, req_id: int, error: str):
         """Handle thumbnail loading error."""
+        if req_id != self._req_id:
+            return
         self.thumbnail_label.setText("No Preview")
     
     def clear(self):
         """Clear the preview."""
+        # Already showing the empty state
+        if self._current_info is None and self.thumbnail_label.pixmap().isNull():
+            return
+        
+        self._cancel_thumbnail()
+        self._req_id += 1  # Drop any thumbnail result still in flight
         self._current_info = None
         self.title_label.setText("No video selected")
         self.channel_label.setText("-")
@@ -3,125 +3,352 @@ YT-DLP GUI - Queue Panel
 Download queue display and management panel.
 """
 
-from typing import Optional
+import re
+from collections import Counter
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Optional
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QListWidget, QListWidgetItem, QMenu,
-    QFrame, QProgressBar, QMessageBox, QFileDialog
+    QPushButton, QListView, QMenu, QMessageBox, QFileDialog,
+    QStyledItemDelegate, QStyle, QStyleOptionProgressBar, QProgressBar
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QAction
+from PySide6.QtCore import (
+    Qt, Signal, QTimer, QObject, QRunnable, QThreadPool,
+    QAbstractListModel, QModelIndex, QRect, QSize
+)
+from PySide6.QtGui import QAction, QColor, QFont, QFontMetrics, QPainter, QPalette
 
 from ..core.queue_manager import (
     QueueManager, QueueItem, QueueItemStatus, get_queue_manager
 )
+from ..core.config import get_config
 from ..core.downloader import get_download_manager
 from ..utils.helpers import format_duration, open_folder
 from ..utils.logger import get_logger
 
 
-class QueueItemWidget(QFrame):
-    """Custom widget for queue item display."""
+_URL_LINE_RE = re.compile(r'^https?://\S+\Z')
+
+
+def _display_title(title: str) -> str:
+    """Truncate a title for display in the queue."""
+    if len(title) > 35:
+        return title[:32] + "..."
+    return title
+
+
+def _status_text(item: QueueItem) -> str:
+    """Get the status line shown under a queue item."""
+    if item.status == QueueItemStatus.DOWNLOADING:
+        return f"{item.progress:.1f}% - {item.speed} - ETA: {item.eta}"
+    elif item.status == QueueItemStatus.PROCESSING:
+        return "Processing..."
+    elif item.status == QueueItemStatus.COMPLETED:
+        return "Completed"
+    elif item.status == QueueItemStatus.FAILED:
+        return f"Failed: {item.error_message[:50]}"
+    elif item.status == QueueItemStatus.PENDING:
+        return "Waiting..."
+    return item.status.value.title()
+
+
+def _visible_signature(item: QueueItem) -> tuple:
+    """Get the fields of an item that affect how its row is painted."""
+    return (
+        item.status, round(item.progress, 1), item.title, item.speed,
+        item.eta, item.quality, item.error_message[:50]
+    )
+
+
+class UrlImportSignals(QObject):
+    """Signals for URL import tasks."""
+    urls_parsed = Signal(list)  # urls
+    error = Signal(str)  # message
+
+
+class UrlImportTask(QRunnable):
+    """Thread pool task that reads URLs from a text file."""
+    
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self.signals = UrlImportSignals()
+    
+    def run(self):
+        try:
+            urls = []
+            seen = set()
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for raw in f:
+                    line = raw.strip()
+                    if line not in seen and _URL_LINE_RE.match(line):
+                        seen.add(line)
+                        urls.append(line)
+            self.signals.urls_parsed.emit(urls)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
+class QueueListModel(QAbstractListModel):
+    """List model exposing queue items to the queue view.
+    
+    Rows are exposed in pages as the view scrolls, so opening a deep queue
+    only realizes the first PAGE_SIZE rows.
+    """
     
-    def __init__(self, item: QueueItem, parent=None):
+    ItemRole = Qt.UserRole + 1  # Returns the QueueItem itself
+    PAGE_SIZE = 200
+    
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.item = item
-        self._setup_ui()
-        self.update_display()
+        self._items: List[QueueItem] = []
+        self._loaded = 0  # Number of rows exposed to the view
+        self._rows: Dict[str, int] = {}  # item_id -> row
+        # Rows below this index have correct entries in _rows; removals lower it
+        # and row_of() re-indexes the tail lazily, so a delete doesn't rewrite it
+        self._valid_rows = 0
+        self._signatures: Dict[str, tuple] = {}  # item_id -> last painted state
+        self._titles: Dict[str, tuple] = {}  # item_id -> (title, display title)
     
-    def _setup_ui(self):
-        self.setFrameShape(QFrame.StyledPanel)
-        self.setStyleSheet("""
-            QueueItemWidget {
-                background-color: #16213e;
-                border-radius: 6px;
-                padding: 8px;
-                margin: 2px;
-            }
-            QueueItemWidget:hover {
-                background-color: #1a2a4e;
-            }
-        """)
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self._loaded
+    
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return self._loaded < len(self._items)
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.PAGE_SIZE, len(self._items) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < self._loaded:
+            return None
+        
+        item = self._items[index.row()]
+        if role == Qt.DisplayRole:
+            return self._display_title(item)
+        if role == Qt.ToolTipRole:
+            return item.title
+        if role == Qt.UserRole:
+            return item.id
+        if role == self.ItemRole:
+            return item
+        return None
+    
+    def set_items(self, items: List[QueueItem]):
+        """Replace all items."""
+        self.beginResetModel()
+        self._items = list(items)
+        self._loaded = min(self.PAGE_SIZE, len(self._items))
+        self._rows = {item.id: row for row, item in enumerate(self._items)}
+        self._valid_rows = len(self._items)
+        self._signatures = {}
+        self._titles = {}
+        self.endResetModel()
+    
+    def add_item(self, item: QueueItem):
+        """Append an item."""
+        row = len(self._items)
+        if self._loaded < row:
+            # Not scrolled to the end yet; the row is exposed by fetchMore
+            self._append(item)
+            return
         
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(10, 8, 10, 8)
-        layout.setSpacing(5)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._append(item)
+        self._loaded += 1
+        self.endInsertRows()
+    
+    def remove_item(self, item_id: str):
+        """Remove an item by ID."""
+        row = self.row_of(item_id)
+        if row < 0:
+            return
+        visible = row < self._loaded
+        if visible:
+            self.beginRemoveRows(QModelIndex(), row, row)
+        self._items.pop(row)
+        del self._rows[item_id]
+        self._valid_rows = min(self._valid_rows, row)
+        self._signatures.pop(item_id, None)
+        self._titles.pop(item_id, None)
+        if visible:
+            self._loaded -= 1
+            self.endRemoveRows()
+    
+    def _append(self, item: QueueItem):
+        """Append an item and record its row."""
+        row = len(self._items)
+        self._items.append(item)
+        self._rows[item.id] = row
+        if self._valid_rows == row:
+            self._valid_rows = row + 1
+    
+    def update_item(self, item: QueueItem):
+        """Replace an item and repaint its row."""
+        row = self.row_of(item.id)
+        if row < 0:
+            return
+        self._items[row] = item
+        self.refresh_row(row)
+    
+    def refresh_row(self, row: int):
+        """Notify the view that a row's data changed, if anything visible did."""
+        if row >= self._loaded:
+            return
+        item = self._items[row]
+        signature = _visible_signature(item)
+        if self._signatures.get(item.id) == signature:
+            return
+        self._signatures[item.id] = signature
         
-        # Top row: status icon + title + quality
-        top_row = QHBoxLayout()
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [self.ItemRole])
+    
+    def _display_title(self, item: QueueItem) -> str:
+        """Get the truncated title for an item, computed once per title."""
+        cached = self._titles.get(item.id)
+        if cached is None or cached[0] is not item.title:
+            cached = (item.title, _display_title(item.title))
+            self._titles[item.id] = cached
+        return cached[1]
+    
+    def get_item(self, item_id: str) -> Optional[QueueItem]:
+        """Get an item by ID."""
+        row = self.row_of(item_id)
+        return self._items[row] if row >= 0 else None
+    
+    def row_of(self, item_id: str) -> int:
+        """Get the row of an item, or -1 if not present."""
+        row = self._rows.get(item_id, -1)
+        if row < self._valid_rows:
+            return row
+        
+        # Entry is past an earlier removal; re-index the stale tail once
+        for i in range(self._valid_rows, len(self._items)):
+            self._rows[self._items[i].id] = i
+        self._valid_rows = len(self._items)
+        return self._rows[item_id]
+
+
+class QueueItemDelegate(QStyledItemDelegate):
+    """Paints queue items directly instead of creating a widget per row."""
+    
+    ITEM_HEIGHT = 72
+    STATUS_TEXT_ALPHA = 150  # status line is drawn in the text color, faded
+    
+    # Status -> (icon, color), built once instead of on every paint
+    STATUS_ICONS = {
+        QueueItemStatus.PENDING: ("⏳", QColor("#8a8aaa")),
+        QueueItemStatus.WAITING: ("⏳", QColor("#8a8aaa")),
+        QueueItemStatus.DOWNLOADING: ("▶", QColor("#4ecdc4")),
+        QueueItemStatus.PROCESSING: ("⚙", QColor("#f9ca24")),
+        QueueItemStatus.COMPLETED: ("✓", QColor("#4ecdc4")),
+        QueueItemStatus.FAILED: ("✗", QColor("#ff6b6b")),
+        QueueItemStatus.CANCELLED: ("⊘", QColor("#8a8aaa")),
+        QueueItemStatus.PAUSED: ("⏸", QColor("#f9ca24")),
+    }
+    UNKNOWN_STATUS_ICON = ("?", QColor("#8a8aaa"))
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._fonts: Dict[str, tuple] = {}  # base font key -> (title font, status font, title height)
+        # Hidden bar used as the style target, so the theme's QProgressBar rules apply
+        self._bar_widget = QProgressBar(parent)
+        self._bar_widget.setTextVisible(False)
+        self._bar_widget.hide()
+    
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        item = index.data(QueueListModel.ItemRole)
+        if item is None:
+            super().paint(painter, option, index)
+            return
+        
+        widget = option.widget
+        style = widget.style() if widget else self._bar_widget.style()
         
-        self.status_icon = QLabel("⏳")
-        self.status_icon.setFixedWidth(20)
-        top_row.addWidget(self.status_icon)
+        painter.save()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, widget)
         
-        self.title_label = QLabel()
-        self.title_label.setStyleSheet("font-weight: bold;")
-        self.title_label.setMaximumWidth(250)
-        top_row.addWidget(self.title_label, 1)
+        # Card background (AlternateBase is set by the theme's queueList rule)
+        card = option.rect.adjusted(2, 2, -2, -2)
+        card_color = option.palette.color(QPalette.AlternateBase)
+        if option.state & QStyle.State_MouseOver:
+            card_color = card_color.darker(108) if card_color.lightness() > 128 else card_color.lighter(140)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(card_color)
+        painter.drawRoundedRect(card, 6, 6)
         
-        self.quality_label = QLabel()
-        self.quality_label.setStyleSheet("color: #e94560;")
-        top_row.addWidget(self.quality_label)
+        content = card.adjusted(10, 8, -10, -8)
         
-        layout.addLayout(top_row)
+        # Top row: status icon + title + quality
+        title_font, status_font, top_height = self._fonts_for(option.font)
+        top = QRect(content.left(), content.top(), content.width(), top_height)
+        
+        icon, color = self.STATUS_ICONS.get(item.status, self.UNKNOWN_STATUS_ICON)
+        painter.setFont(option.font)
+        painter.setPen(color)
+        painter.drawText(QRect(top.left(), top.top(), 20, top_height), Qt.AlignLeft | Qt.AlignVCenter, icon)
+        
+        quality_width = option.fontMetrics.horizontalAdvance(item.quality)
+        painter.setPen(option.palette.color(QPalette.Highlight))
+        painter.drawText(
+            QRect(top.right() - quality_width, top.top(), quality_width, top_height),
+            Qt.AlignRight | Qt.AlignVCenter, item.quality
+        )
+        
+        title_rect = QRect(top.left() + 25, top.top(), top.width() - 25 - quality_width - 8, top_height)
+        painter.setFont(title_font)
+        painter.setPen(option.palette.color(QPalette.Text))
+        painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignVCenter, index.data(Qt.DisplayRole))
         
         # Progress row
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setMaximumHeight(8)
-        self.progress_bar.setTextVisible(False)
-        layout.addWidget(self.progress_bar)
+        bar = QStyleOptionProgressBar()
+        bar.rect = QRect(content.left(), top.bottom() + 6, content.width(), 8)
+        bar.minimum = 0
+        bar.maximum = 100
+        bar.progress = int(item.progress)
+        bar.textVisible = False
+        bar.state = QStyle.State_Enabled | QStyle.State_Horizontal
+        self._bar_widget.style().drawControl(QStyle.CE_ProgressBar, bar, painter, self._bar_widget)
         
         # Status row
-        self.status_label = QLabel()
-        self.status_label.setStyleSheet("color: #8a8aaa; font-size: 11px;")
-        layout.addWidget(self.status_label)
-    
-    def update_display(self):
-        """Update widget display from item data."""
-        # Title (truncated)
-        title = self.item.title
-        if len(title) > 35:
-            title = title[:32] + "..."
-        self.title_label.setText(title)
-        self.title_label.setToolTip(self.item.title)
-        
-        # Quality
-        self.quality_label.setText(self.item.quality)
-        
-        # Status icon and styling
-        status_icons = {
-            QueueItemStatus.PENDING: ("⏳", "#8a8aaa"),
-            QueueItemStatus.WAITING: ("⏳", "#8a8aaa"),
-            QueueItemStatus.DOWNLOADING: ("▶", "#4ecdc4"),
-            QueueItemStatus.PROCESSING: ("⚙", "#f9ca24"),
-            QueueItemStatus.COMPLETED: ("✓", "#4ecdc4"),
-            QueueItemStatus.FAILED: ("✗", "#ff6b6b"),
-            QueueItemStatus.CANCELLED: ("⊘", "#8a8aaa"),
-            QueueItemStatus.PAUSED: ("⏸", "#f9ca24"),
-        }
-        
-        icon, color = status_icons.get(self.item.status, ("?", "#8a8aaa"))
-        self.status_icon.setText(icon)
-        self.status_icon.setStyleSheet(f"color: {color};")
-        
-        # Progress
-        self.progress_bar.setValue(int(self.item.progress))
-        
-        # Status text
-        if self.item.status == QueueItemStatus.DOWNLOADING:
-            status = f"{self.item.progress:.1f}% - {self.item.speed} - ETA: {self.item.eta}"
-        elif self.item.status == QueueItemStatus.PROCESSING:
-            status = "Processing..."
-        elif self.item.status == QueueItemStatus.COMPLETED:
-            status = "Completed"
-        elif self.item.status == QueueItemStatus.FAILED:
-            status = f"Failed: {self.item.error_message[:50]}"
-        elif self.item.status == QueueItemStatus.PENDING:
-            status = "Waiting..."
-        else:
-            status = self.item.status.value.title()
-        
-        self.status_label.setText(status)
+        painter.setFont(status_font)
+        status_color = option.palette.color(QPalette.Text)
+        status_color.setAlpha(self.STATUS_TEXT_ALPHA)
+        painter.setPen(status_color)
+        status_rect = QRect(content.left(), bar.rect.bottom() + 5, content.width(), content.bottom() - bar.rect.bottom() - 5)
+        painter.drawText(status_rect, Qt.AlignLeft | Qt.AlignVCenter, _status_text(item))
+        
+        painter.restore()
+    
+    def _fonts_for(self, font: QFont) -> tuple:
+        """Get the derived fonts for a base font, built once per font."""
+        key = font.key()
+        fonts = self._fonts.get(key)
+        if fonts is None:
+            title_font = QFont(font)
+            title_font.setBold(True)
+            status_font = QFont(font)
+            status_font.setPixelSize(11)
+            fonts = (title_font, status_font, QFontMetrics(title_font).height())
+            self._fonts[key] = fonts
+        return fonts
+    
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        return QSize(option.rect.width(), self.ITEM_HEIGHT)
 
 
 class QueuePanel(QWidget):
@@ -129,12 +356,32 @@ class QueuePanel(QWidget):
     
     item_double_clicked = Signal(str)  # item_id
     
+    IMPORT_BATCH_SIZE = 100
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = get_logger()
         self.queue = get_queue_manager()
         self.download_manager = get_download_manager()
-        self._item_widgets: dict = {}
+        
+        # Latest progress per item, flushed to the view at most every 150 ms
+        self._pending_progress: dict = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(150)
+        self._flush_timer.timeout.connect(self._flush_progress)
+        
+        # Set while adding many items at once; stats are updated afterwards
+        self._bulk_adding = False
+        
+        # Per-status item counts, kept in sync from queue signals
+        self._status_counts: Counter = Counter()
+        self._item_statuses: Dict[str, QueueItemStatus] = {}
+        
+        # URL import state; parsed URLs are added in batches
+        self._import_dialog: Optional[QFileDialog] = None
+        self._import_task: Optional[UrlImportTask] = None
+        self._import_urls_pending: List[str] = []
+        self._import_offset = 0
         
         self._setup_ui()
         self._connect_signals()
@@ -149,24 +396,32 @@ class QueuePanel(QWidget):
         header = QHBoxLayout()
         
         title = QLabel("📋 Download Queue")
-        title.setStyleSheet("font-size: 14px; font-weight: bold;")
+        title.setObjectName("panelTitleLabel")
         header.addWidget(title)
         
         header.addStretch()
         
         # Stats
         self.stats_label = QLabel("0 items")
-        self.stats_label.setStyleSheet("color: #8a8aaa;")
+        self.stats_label.setObjectName("queueStatsLabel")
         header.addWidget(self.stats_label)
         
         layout.addLayout(header)
         
-        # Queue list
-        self.queue_list = QListWidget()
+        # Queue list (model/view: rows are painted by the delegate, not widgets)
+        self.queue_model = QueueListModel(self)
+        self.queue_list = QListView()
+        self.queue_list.setObjectName("queueList")
+        self.queue_list.setModel(self.queue_model)
+        self.queue_list.setItemDelegate(QueueItemDelegate(self.queue_list))
+        self.queue_list.setUniformItemSizes(True)
+        self.queue_list.setLayoutMode(QListView.Batched)
+        self.queue_list.setBatchSize(50)
+        self.queue_list.setMouseTracking(True)
         self.queue_list.setSpacing(4)
         self.queue_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.queue_list.customContextMenuRequested.connect(self._show_context_menu)
-        self.queue_list.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.queue_list.doubleClicked.connect(self._on_item_double_clicked)
         layout.addWidget(self.queue_list)
         
         # Control buttons
@@ -194,6 +449,8 @@ class QueuePanel(QWidget):
         import_layout.addStretch()
         
         layout.addLayout(import_layout)
+        
+        self._build_context_menu()
     
     def _connect_signals(self):
         """Connect signals."""
@@ -215,120 +472,168 @@ class QueuePanel(QWidget):
     
     def _refresh_queue(self):
         """Refresh the entire queue display."""
-        self.queue_list.clear()
-        self._item_widgets.clear()
-        
-        for item in self.queue.get_all_items():
-            self._add_item_to_list(item)
+        items = self.queue.get_all_items()
+        self._item_statuses = {item.id: item.status for item in items}
+        self._status_counts = Counter(self._item_statuses.values())
         
+        self.queue_list.setUpdatesEnabled(False)
+        self.queue_list.blockSignals(True)
+        try:
+            self.queue_model.set_items(items)
+        finally:
+            self.queue_list.blockSignals(False)
+            self.queue_list.setUpdatesEnabled(True)
+            self.queue_list.viewport().update()
         self._update_stats()
     
-    def _add_item_to_list(self, item: QueueItem):
-        """Add item to the list widget."""
-        widget = QueueItemWidget(item)
-        list_item = QListWidgetItem(self.queue_list)
-        list_item.setData(Qt.UserRole, item.id)
-        list_item.setSizeHint(widget.sizeHint())
-        self.queue_list.setItemWidget(list_item, widget)
-        self._item_widgets[item.id] = widget
-    
     def _on_item_added(self, item: QueueItem):
         """Handle new item added."""
-        self._add_item_to_list(item)
-        self._update_stats()
+        self.queue_model.add_item(item)
+        self._track_status(item)
+        if not self._bulk_adding:
+            self._update_stats()
     
     def _on_item_removed(self, item_id: str):
         """Handle item removed."""
-        for i in range(self.queue_list.count()):
-            list_item = self.queue_list.item(i)
-            if list_item.data(Qt.UserRole) == item_id:
-                self.queue_list.takeItem(i)
-                break
-        self._item_widgets.pop(item_id, None)
+        self.queue_model.remove_item(item_id)
+        old = self._item_statuses.pop(item_id, None)
+        if old is not None:
+            self._status_counts[old] -= 1
         self._update_stats()
     
     def _on_item_updated(self, item: QueueItem):
         """Handle item update."""
-        widget = self._item_widgets.get(item.id)
-        if widget:
-            widget.item = item
-            widget.update_display()
+        self.queue_model.update_item(item)
+        if self._track_status(item):
+            self._update_stats()
+    
+    def _track_status(self, item: QueueItem) -> bool:
+        """Record an item's status in the counts. Returns True if it changed."""
+        old = self._item_statuses.get(item.id)
+        if old == item.status:
+            return False
+        if old is not None:
+            self._status_counts[old] -= 1
+        self._status_counts[item.status] += 1
+        self._item_statuses[item.id] = item.status
+        return True
     
     def _on_progress(self, item_id: str, progress):
         """Handle download progress."""
-        widget = self._item_widgets.get(item_id)
-        if widget:
-            widget.item.progress = progress.percent
-            widget.item.speed = progress.speed
-            widget.item.eta = progress.eta
-            widget.update_display()
+        self._pending_progress[item_id] = progress
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_progress(self):
+        """Apply coalesced progress updates to the queue view."""
+        if not self._pending_progress:
+            self._flush_timer.stop()
+            return
+        
+        pending, self._pending_progress = self._pending_progress, {}
+        for item_id, progress in pending.items():
+            row = self.queue_model.row_of(item_id)
+            if row < 0:
+                continue
+            item = self.queue_model.get_item(item_id)
+            item.progress = progress.percent
+            item.speed = progress.speed
+            item.eta = progress.eta
+            self.queue_model.refresh_row(row)
     
     def _on_finished(self, item_id: str, success: bool, message: str):
         """Handle download finished."""
+        item = self.queue_model.get_item(item_id)
+        if item:
+            self._track_status(item)
         self._update_stats()
     
     def _update_stats(self):
         """Update statistics label."""
-        stats = self.queue.get_queue_stats()
+        counts = self._status_counts
+        downloading = counts[QueueItemStatus.DOWNLOADING] + counts[QueueItemStatus.PROCESSING]
         parts = []
-        if stats['downloading'] > 0:
-            parts.append(f"{stats['downloading']} downloading")
-        if stats['pending'] > 0:
-            parts.append(f"{stats['pending']} pending")
-        if stats['completed'] > 0:
-            parts.append(f"{stats['completed']} done")
-        if stats['failed'] > 0:
-            parts.append(f"{stats['failed']} failed")
+        if downloading > 0:
+            parts.append(f"{downloading} downloading")
+        if counts[QueueItemStatus.PENDING] > 0:
+            parts.append(f"{counts[QueueItemStatus.PENDING]} pending")
+        if counts[QueueItemStatus.COMPLETED] > 0:
+            parts.append(f"{counts[QueueItemStatus.COMPLETED]} done")
+        if counts[QueueItemStatus.FAILED] > 0:
+            parts.append(f"{counts[QueueItemStatus.FAILED]} failed")
         
         self.stats_label.setText(" | ".join(parts) if parts else "Empty")
     
     def _show_context_menu(self, pos):
         """Show context menu for queue items."""
-        item = self.queue_list.itemAt(pos)
-        if not item:
+        index = self.queue_list.indexAt(pos)
+        if not index.isValid():
             return
         
-        item_id = item.data(Qt.UserRole)
+        item_id = index.data(Qt.UserRole)
         queue_item = self.queue.get_item(item_id)
         if not queue_item:
             return
         
+        status = queue_item.status
+        self._context_item_id = item_id
+        self._start_action.setVisible(status in (QueueItemStatus.PENDING, QueueItemStatus.FAILED))
+        self._cancel_action.setVisible(status == QueueItemStatus.DOWNLOADING)
+        self._retry_action.setVisible(status == QueueItemStatus.FAILED)
+        self._folder_action.setVisible(status == QueueItemStatus.COMPLETED)
+        
+        self._context_menu.exec_(self.queue_list.mapToGlobal(pos))
+    
+    def _build_context_menu(self):
+        """Build the item context menu once; actions are shown per item status."""
+        self._context_item_id: Optional[str] = None
         menu = QMenu(self)
         
-        if queue_item.status in (QueueItemStatus.PENDING, QueueItemStatus.FAILED):
-            start_action = menu.addAction("▶ Start Download")
-            start_action.triggered.connect(lambda: self._start_single(item_id))
+        self._start_action = menu.addAction("▶ Start Download")
+        self._start_action.triggered.connect(partial(self._on_context_action, self._start_single))
         
-        if queue_item.status == QueueItemStatus.DOWNLOADING:
-            cancel_action = menu.addAction("⏹ Cancel")
-            cancel_action.triggered.connect(lambda: self._cancel_download(item_id))
+        self._cancel_action = menu.addAction("⏹ Cancel")
+        self._cancel_action.triggered.connect(partial(self._on_context_action, self._cancel_download))
         
-        if queue_item.status == QueueItemStatus.FAILED:
-            retry_action = menu.addAction("🔄 Retry")
-            retry_action.triggered.connect(lambda: self._retry_download(item_id))
+        self._retry_action = menu.addAction("🔄 Retry")
+        self._retry_action.triggered.connect(partial(self._on_context_action, self._retry_download))
         
-        if queue_item.status == QueueItemStatus.COMPLETED:
-            folder_action = menu.addAction("📁 Open Folder")
-            folder_action.triggered.connect(lambda: self._open_folder(queue_item))
+        self._folder_action = menu.addAction("📁 Open Folder")
+        self._folder_action.triggered.connect(partial(self._on_context_action, self._open_item_folder))
         
         menu.addSeparator()
         
         move_up = menu.addAction("⬆ Move Up")
-        move_up.triggered.connect(lambda: self.queue.move_item(item_id, -1))
+        move_up.triggered.connect(partial(self._on_context_action, partial(self._move_item, -1)))
         
         move_down = menu.addAction("⬇ Move Down")
-        move_down.triggered.connect(lambda: self.queue.move_item(item_id, 1))
+        move_down.triggered.connect(partial(self._on_context_action, partial(self._move_item, 1)))
         
         menu.addSeparator()
         
         remove_action = menu.addAction("🗑 Remove")
-        remove_action.triggered.connect(lambda: self.queue.remove_item(item_id))
+        remove_action.triggered.connect(partial(self._on_context_action, self.queue.remove_item))
         
-        menu.exec_(self.queue_list.mapToGlobal(pos))
+        self._context_menu = menu
+    
+    def _on_context_action(self, handler, *_):
+        """Run a context menu handler for the item the menu was opened on."""
+        if self._context_item_id:
+            handler(self._context_item_id)
     
-    def _on_item_double_clicked(self, list_item: QListWidgetItem):
+    def _move_item(self, direction: int, item_id: str):
+        """Move item up or down in the queue."""
+        self.queue.move_item(item_id, direction)
+    
+    def _open_item_folder(self, item_id: str):
+        """Open the output folder of a queue item."""
+        queue_item = self.queue.get_item(item_id)
+        if queue_item:
+            self._open_folder(queue_item)
+    
+    def _on_item_double_clicked(self, index: QModelIndex):
         """Handle double-click on item."""
-        item_id = list_item.data(Qt.UserRole)
+        item_id = index.data(Qt.UserRole)
         self.item_double_clicked.emit(item_id)
     
     def _start_queue(self):
@@ -362,32 +667,89 @@ class QueuePanel(QWidget):
     
     def _open_folder(self, item: QueueItem):
         """Open download folder."""
-        from pathlib import Path
         folder = Path(item.output_path)
-        if folder.exists():
+        if folder.is_dir():
             open_folder(folder)
     
     def _import_urls(self):
         """Import URLs from file."""
-        file, _ = QFileDialog.getOpenFileName(
-            self, "Import URLs", "", "Text Files (*.txt);;All Files (*)"
-        )
-        if not file:
-            return
+        config = get_config()
+        if self._import_dialog is None:
+            # Created once and reused so later imports open faster
+            self._import_dialog = QFileDialog(
+                self, "Import URLs", config.settings.ui.import_dir,
+                "Text Files (*.txt);;All Files (*)"
+            )
+            self._import_dialog.setFileMode(QFileDialog.ExistingFile)
         
+        if not self._import_dialog.exec():
+            return
+        file = self._import_dialog.selectedFiles()[0]
+        
+        import_dir = self._import_dialog.directory().absolutePath()
+        if import_dir != config.settings.ui.import_dir:
+            config.settings.ui.import_dir = import_dir
+            config.mark_dirty()
+            QTimer.singleShot(2000, config.save_if_dirty)
+        
+        self.import_btn.setEnabled(False)
+        self.import_btn.setText("⏳ Importing...")
+        
+        task = UrlImportTask(file)
+        task.signals.urls_parsed.connect(self._on_urls_parsed)
+        task.signals.error.connect(self._on_import_error)
+        self._import_task = task
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_urls_parsed(self, urls: list):
+        """Start adding URLs parsed by the import task."""
+        self._import_task = None
+        queued = {item.url for item in self.queue.get_all_items()}
+        self._import_urls_pending = [url for url in urls if url not in queued]
+        self._import_offset = 0
+        self._add_import_batch()
+    
+    def _add_import_batch(self):
+        """Add the next batch of imported URLs, yielding to the event loop between batches."""
+        batch = self._import_urls_pending[self._import_offset:self._import_offset + self.IMPORT_BATCH_SIZE]
+        self._import_offset += len(batch)
+        
+        self._bulk_adding = True
+        self.queue_list.setUpdatesEnabled(False)
+        self.queue_list.blockSignals(True)
         try:
-            with open(file, 'r', encoding='utf-8') as f:
-                urls = [line.strip() for line in f if line.strip()]
-            
-            for url in urls:
-                if url.startswith('http'):
-                    self.queue.add_url(url=url, title=f"URL: {url[:50]}...")
-            
-            self.logger.info(f"Imported {len(urls)} URLs from file")
-            QMessageBox.information(
-                self, "Import Complete",
-                f"Added {len(urls)} URLs to queue"
-            )
-        except Exception as e:
-            self.logger.error(f"Import error: {e}")
-            QMessageBox.warning(self, "Import Error", str(e))
+            for url in batch:
+                self.queue.add_url(url=url, title=f"URL: {url[:50]}...")
+        finally:
+            self._bulk_adding = False
+            self.queue_list.blockSignals(False)
+            self.queue_list.setUpdatesEnabled(True)
+            self.queue_list.viewport().update()
+            self._update_stats()
+        
+        if self._import_offset < len(self._import_urls_pending):
+            QTimer.singleShot(0, self._add_import_batch)
+            return
+        
+        count = len(self._import_urls_pending)
+        self._import_urls_pending = []
+        self._import_offset = 0
+        self._finish_import()
+        
+        self.logger.info(f"Imported {count} URLs from file")
+        QMessageBox.information(
+            self, "Import Complete",
+            f"Added {count} URLs to queue"
+        )
+    
+    def _on_import_error(self, message: str):
+        """Handle URL import failure."""
+        self._import_task = None
+        self._finish_import()
+        self.logger.error(f"Import error: {message}")
+        QMessageBox.warning(self, "Import Error", message)
+    
+    def _finish_import(self):
+        """Restore the import button."""
+        self.import_btn.setEnabled(True)
+        self.import_btn.setText("📥 Import URLs")
@@ -3,16 +3,20 @@ YT-DLP GUI - FFmpeg Downloader
 Auto-download FFmpeg if not present.
 """
 
+import io
 import os
 import zipfile
 import shutil
+import tempfile
 import threading
+import time
 from pathlib import Path
 from typing import Optional, Callable
 import urllib.request
 
 from PySide6.QtCore import QObject, Signal
 
+from .helpers import invalidate_tool_paths
 from .logger import get_logger
 
 
@@ -29,10 +33,18 @@ class FFmpegDownloader:
     # FFmpeg download URL (Windows builds)
     FFMPEG_URL = "https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/ffmpeg-master-latest-win64-gpl.zip"
     
+    CHUNK_SIZE = 1024 * 1024
+    MEMORY_ARCHIVE_LIMIT = 256 * 1024 * 1024  # Larger archives go to an anonymous temp file
+    PROGRESS_INTERVAL = 0.1  # seconds between progress signals
+    
     def __init__(self):
         self.logger = get_logger()
         self.signals = FFmpegDownloaderSignals()
         self._is_downloading = False
+        
+        # Result of the last get_ffmpeg_path lookup, reset on install
+        self._cached_path: Optional[Path] = None
+        self._cache_valid = False
     
     def get_ffmpeg_dir(self) -> Path:
         """Get the directory where FFmpeg should be installed."""
@@ -49,6 +61,15 @@ class FFmpegDownloader:
     
     def get_ffmpeg_path(self) -> Optional[Path]:
         """Get path to ffmpeg.exe if it exists."""
+        if self._cache_valid:
+            return self._cached_path
+        
+        self._cached_path = self._find_ffmpeg()
+        self._cache_valid = True
+        return self._cached_path
+    
+    def _find_ffmpeg(self) -> Optional[Path]:
+        """Look for ffmpeg.exe in the bin folder, then in PATH."""
         bin_dir = self.get_ffmpeg_dir()
         ffmpeg = bin_dir / "ffmpeg.exe"
         
@@ -56,13 +77,18 @@ class FFmpegDownloader:
             return ffmpeg
         
         # Check if ffmpeg is in PATH
-        import shutil as sh
-        ffmpeg_in_path = sh.which("ffmpeg")
+        ffmpeg_in_path = shutil.which("ffmpeg")
         if ffmpeg_in_path:
             return Path(ffmpeg_in_path)
         
         return None
     
+    def _archive_buffer(self, size: int):
+        """Get a buffer for the downloaded archive: memory if small enough, else a temp file."""
+        if 0 < size <= self.MEMORY_ARCHIVE_LIMIT:
+            return io.BytesIO()
+        return tempfile.TemporaryFile()
+    
     def is_installed(self) -> bool:
         """Check if FFmpeg is installed."""
         return self.get_ffmpeg_path() is not None
@@ -79,36 +105,50 @@ class FFmpegDownloader:
                 bin_dir = self.get_ffmpeg_dir()
                 bin_dir.mkdir(parents=True, exist_ok=True)
                 
-                zip_path = bin_dir / "ffmpeg.zip"
-                
                 self.signals.status.emit("Downloading FFmpeg...")
                 self.logger.info("Downloading FFmpeg...")
                 
-                # Download with progress
-                def report_progress(block_num, block_size, total_size):
-                    if total_size > 0:
-                        percent = min(int(block_num * block_size * 100 / total_size), 100)
-                        self.signals.progress.emit(percent)
+                # Download in large chunks, throttling progress signals
+                with urllib.request.urlopen(self.FFMPEG_URL) as response:
+                    total_size = int(response.headers.get('Content-Length', 0))
+                    archive = self._archive_buffer(total_size)
+                    downloaded = 0
+                    last_report = 0.0
+                    while True:
+                        chunk = response.read(self.CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        archive.write(chunk)
+                        downloaded += len(chunk)
+                        
+                        now = time.monotonic()
+                        if total_size > 0 and now - last_report >= self.PROGRESS_INTERVAL:
+                            self.signals.progress.emit(min(downloaded * 100 // total_size, 100))
+                            last_report = now
                 
-                urllib.request.urlretrieve(self.FFMPEG_URL, zip_path, report_progress)
+                if total_size > 0:
+                    self.signals.progress.emit(100)
                 
                 self.signals.status.emit("Extracting FFmpeg...")
                 self.logger.info("Extracting FFmpeg...")
                 
                 # Extract
-                with zipfile.ZipFile(zip_path, 'r') as zf:
-                    # Find the bin folder inside the zip
-                    for name in zf.namelist():
-                        if name.endswith('ffmpeg.exe'):
-                            # Extract just ffmpeg.exe
-                            with zf.open(name) as src, open(bin_dir / "ffmpeg.exe", 'wb') as dst:
-                                dst.write(src.read())
-                        elif name.endswith('ffprobe.exe'):
-                            with zf.open(name) as src, open(bin_dir / "ffprobe.exe", 'wb') as dst:
-                                dst.write(src.read())
+                archive.seek(0)
+                with archive, zipfile.ZipFile(archive, 'r') as zf:
+                    # Find ffmpeg.exe and ffprobe.exe in a single namelist scan
+                    members = {
+                        name.rsplit('/', 1)[-1]: name
+                        for name in zf.namelist()
+                        if name.endswith(('ffmpeg.exe', 'ffprobe.exe'))
+                    }
+                    for exe_name, member in members.items():
+                        with zf.open(member) as src, open(bin_dir / exe_name, 'wb') as dst:
+                            shutil.copyfileobj(src, dst, self.CHUNK_SIZE)
                 
-                # Clean up zip file
-                zip_path.unlink()
+                # Let cached lookups find the new ffmpeg.exe
+                self._cached_path = bin_dir / "ffmpeg.exe"
+                self._cache_valid = True
+                invalidate_tool_paths()
                 
                 self.logger.info("FFmpeg installed successfully")
                 self.signals.status.emit("FFmpeg installed!")
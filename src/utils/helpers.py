@@ -6,10 +6,28 @@ Common utility functions used throughout the application.
 import os
 import re
 import subprocess
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 
+# Patterns and tables built once at import time
+_URL_RE = re.compile(
+    r'^https?://'
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'
+    r'localhost|'
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
+    r'(?::\d+)?'
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE
+)
+_VIDEO_ID_RE = re.compile(r'(?:youtube\.com/(?:watch\?v=|embed/|v/)|youtu\.be/)([a-zA-Z0-9_-]{11})')
+_INVALID_FN_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})  # Invalid Windows filename characters
+
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+@lru_cache(maxsize=4096)
 def format_duration(seconds: int) -> str:
     """Convert seconds to HH:MM:SS format."""
     if seconds < 0:
@@ -24,6 +42,7 @@ def format_duration(seconds: int) -> str:
     return f"{minutes:02d}:{secs:02d}"
 
 
+@lru_cache(maxsize=1024)
 def parse_duration(time_str: str) -> int:
     """Parse HH:MM:SS or MM:SS format to seconds."""
     parts = time_str.strip().split(':')
@@ -44,17 +63,11 @@ def format_size(bytes_size: int) -> str:
     if bytes_size < 0:
         return "0 B"
     
-    units = ['B', 'KB', 'MB', 'GB', 'TB']
-    unit_index = 0
-    size = float(bytes_size)
-    
-    while size >= 1024 and unit_index < len(units) - 1:
-        size /= 1024
-        unit_index += 1
-    
+    # Each unit is 2**10 of the previous, so the bit length picks the unit directly
+    unit_index = min(max(int(bytes_size).bit_length() - 1, 0) // 10, len(_UNITS) - 1)
     if unit_index == 0:
-        return f"{int(size)} {units[unit_index]}"
-    return f"{size:.2f} {units[unit_index]}"
+        return f"{int(bytes_size)} B"
+    return f"{bytes_size / (1 << (unit_index * 10)):.2f} {_UNITS[unit_index]}"
 
 
 def format_speed(bytes_per_second: float) -> str:
@@ -65,8 +78,7 @@ def format_speed(bytes_per_second: float) -> str:
 def sanitize_filename(filename: str) -> str:
     """Remove invalid characters from filename."""
     # Replace invalid Windows filename characters
-    invalid_chars = r'[<>:"/\\|?*]'
-    sanitized = re.sub(invalid_chars, '_', filename)
+    sanitized = filename.translate(_INVALID_FN_TABLE)
     # Remove leading/trailing dots and spaces
     sanitized = sanitized.strip('. ')
     # Limit length
@@ -77,25 +89,16 @@ def sanitize_filename(filename: str) -> str:
 
 def is_valid_url(url: str) -> bool:
     """Check if the string is a valid URL."""
-    url_pattern = re.compile(
-        r'^https?://'
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'
-        r'localhost|'
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-        r'(?::\d+)?'
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE
-    )
-    return bool(url_pattern.match(url))
+    return bool(_URL_RE.match(url))
 
 
+@lru_cache(maxsize=1)
 def get_app_directory() -> Path:
     """Get the application's root directory.
     
     When running as compiled EXE, returns the directory containing the EXE.
     When running from source, returns the project root directory.
     """
-    import sys
-    
     # Check if running as compiled executable (PyInstaller)
     if getattr(sys, 'frozen', False):
         # Running as compiled executable
@@ -105,57 +108,46 @@ def get_app_directory() -> Path:
         return Path(os.path.dirname(os.path.abspath(__file__))).parent.parent
 
 
+@lru_cache(maxsize=1)
 def get_exe_directory() -> Path:
     """Get the directory containing the running executable.
     
     This is specifically for finding files relative to the EXE location,
     not the temp extraction directory that PyInstaller uses.
     """
-    import sys
-    
     if getattr(sys, 'frozen', False):
         return Path(sys.executable).parent
     else:
         return get_app_directory()
 
 
+@lru_cache(maxsize=1)
 def get_bin_directory() -> Path:
     """Get the bin directory containing executables."""
     return get_app_directory() / 'bin'
 
 
-def get_ytdlp_path() -> Optional[Path]:
-    """Get the path to yt-dlp executable."""
-    import sys
-    
-    # If running as EXE, check next to the executable first
-    if getattr(sys, 'frozen', False):
-        exe_dir = Path(sys.executable).parent
-        
-        # Check next to EXE
-        exe_path = exe_dir / 'yt-dlp.exe'
-        if exe_path.exists():
-            return exe_path
-        
-        # Check in bin subfolder next to EXE
-        bin_path = exe_dir / 'bin' / 'yt-dlp.exe'
-        if bin_path.exists():
-            return bin_path
-    
-    # Check in bin directory (source mode)
-    bin_path = get_bin_directory() / 'yt-dlp.exe'
-    if bin_path.exists():
-        return bin_path
+def _find_exe(dirs, name: str) -> Optional[Path]:
+    """Find an executable in the first directory that contains it.
     
-    # Check in app root
-    root_path = get_app_directory() / 'yt-dlp.exe'
-    if root_path.exists():
-        return root_path
-    
-    # Check in PATH
+    Reads each directory once instead of stat-ing candidate paths one by one.
+    """
+    target = name.lower()  # Windows file names are case-insensitive
+    for directory in dirs:
+        try:
+            with os.scandir(directory) as entries:
+                if any(entry.name.lower() == target for entry in entries):
+                    return Path(directory) / name
+        except OSError:
+            continue
+    return None
+
+
+def _where(name: str) -> Optional[Path]:
+    """Look up an executable in PATH."""
     try:
         result = subprocess.run(
-            ['where', 'yt-dlp'],
+            ['where', name],
             capture_output=True,
             text=True,
             creationflags=subprocess.CREATE_NO_WINDOW
@@ -168,59 +160,58 @@ def get_ytdlp_path() -> Optional[Path]:
     return None
 
 
-def get_ffmpeg_path() -> Optional[Path]:
-    """Get the path to ffmpeg executable."""
-    import sys
+def _tool_directories(include_app_root: bool) -> List[Path]:
+    """Get the directories searched for bundled executables, in priority order."""
+    dirs = []
     
-    # If running as EXE, check next to the executable first
+    # If running as EXE, check next to the executable first, then its bin subfolder
     if getattr(sys, 'frozen', False):
         exe_dir = Path(sys.executable).parent
-        
-        # Check next to EXE
-        exe_path = exe_dir / 'ffmpeg.exe'
-        if exe_path.exists():
-            return exe_path
-        
-        # Check in bin subfolder next to EXE
-        bin_path = exe_dir / 'bin' / 'ffmpeg.exe'
-        if bin_path.exists():
-            return bin_path
+        dirs += [exe_dir, exe_dir / 'bin']
     
-    # Check in bin directory (source mode)
-    bin_path = get_bin_directory() / 'ffmpeg.exe'
-    if bin_path.exists():
-        return bin_path
+    # Bin directory (source mode)
+    dirs.append(get_bin_directory())
     
-    # Check in PATH
-    try:
-        result = subprocess.run(
-            ['where', 'ffmpeg'],
-            capture_output=True,
-            text=True,
-            creationflags=subprocess.CREATE_NO_WINDOW
-        )
-        if result.returncode == 0:
-            return Path(result.stdout.strip().split('\n')[0])
-    except Exception:
-        pass
+    if include_app_root:
+        dirs.append(get_app_directory())
     
-    return None
+    return dirs
+
+
+# Tool name -> path of tools that were found. Misses are not cached, so a
+# tool placed in bin/ while the app is running is picked up on the next lookup.
+_tool_paths: Dict[str, Path] = {}
+
+
+def _lookup_tool(name: str, include_app_root: bool) -> Optional[Path]:
+    """Find a bundled or PATH executable, caching it once found."""
+    path = _tool_paths.get(name)
+    if path is None:
+        path = _find_exe(_tool_directories(include_app_root), f'{name}.exe') or _where(name)
+        if path is not None:
+            _tool_paths[name] = path
+    return path
+
+
+def get_ytdlp_path() -> Optional[Path]:
+    """Get the path to yt-dlp executable."""
+    return _lookup_tool('yt-dlp', include_app_root=True)
+
+
+def get_ffmpeg_path() -> Optional[Path]:
+    """Get the path to ffmpeg executable."""
+    return _lookup_tool('ffmpeg', include_app_root=False)
+
+
+def invalidate_tool_paths():
+    """Forget cached tool lookups, e.g. after installing FFmpeg."""
+    _tool_paths.clear()
 
 
 def extract_video_id(url: str) -> Optional[str]:
     """Extract video ID from YouTube URL."""
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=|youtu\.be\/)([a-zA-Z0-9_-]{11})',
-        r'youtube\.com\/embed\/([a-zA-Z0-9_-]{11})',
-        r'youtube\.com\/v\/([a-zA-Z0-9_-]{11})',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    
-    return None
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
 
 
 def get_thumbnail_url(video_id: str, quality: str = 'maxresdefault') -> str:
@@ -234,4 +225,9 @@ def open_folder(path: Path):
         path = path.parent
     
     if path.exists():
-        os.startfile(str(path))
+        # Detached spawn so a slow shell start never stalls the GUI thread
+        subprocess.Popen(
+            ['explorer', str(path)],
+            creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+            close_fds=True
+        )
@@ -3,16 +3,128 @@ YT-DLP GUI - Logger Module
 Custom logging system with GUI signal emission and file rotation.
 """
 
+import atexit
+import heapq
+import itertools
 import logging
-import os
-from datetime import datetime
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Qt, Signal, Slot
+
+
+__all__ = ['LogSignalEmitter', 'get_logger']
+
+_LOG_DIR = Path(__file__).resolve().parent.parent.parent / 'logs'
+_LOG_DIR.mkdir(exist_ok=True)
+_LOG_FILE = _LOG_DIR / 'yt-dlp-gui.log'
+
+# Interned level names for the standard levels, looked up by levelno
+_LEVEL_NAMES = {
+    level: sys.intern(logging.getLevelName(level))
+    for level in (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL)
+}
 
 
 class LogSignalEmitter(QObject):
-    """Qt signal emitter for log messages."""
-    log_message = Signal(str, str, str)  # level, timestamp, message
+    """Qt signal emitter for log messages.
+    
+    Records are buffered and delivered every BATCH_INTERVAL_MS as one
+    log_batch emission instead of one queued signal per record.
+    
+    If the GUI thread stalls, the buffer keeps only the newest MAX_BUFFERED
+    records; older ones are dropped and reported through records_dropped.
+    ERROR and CRITICAL records are held separately and never dropped.
+    """
+    log_batch = Signal(list)  # [(level, timestamp, message), ...]
+    records_dropped = Signal(int)  # records dropped since the previous batch
+    _wake = Signal()
+    
+    BATCH_INTERVAL_MS = 50
+    MAX_BUFFERED = 10000
+    
+    def __init__(self):
+        super().__init__()
+        # Entries are (seq, level, timestamp, message); seq restores order on flush
+        self.buf = deque(maxlen=self.MAX_BUFFERED)
+        self._errors = deque()
+        self._seq = itertools.count()
+        self._pending = False
+        self._dropped = 0
+        self.dropped_count = 0
+        self._lock = threading.Lock()
+        # Queued so the flush timer is always started from the emitter's own thread
+        self._wake.connect(self._schedule_flush, Qt.QueuedConnection)
+    
+    def add(self, level: str, timestamp: str, message: str, levelno: int = logging.INFO):
+        """Buffer a record; safe to call from any thread."""
+        with self._lock:
+            entry = (next(self._seq), level, timestamp, message)
+            if levelno >= logging.ERROR:
+                self._errors.append(entry)
+            else:
+                if len(self.buf) == self.MAX_BUFFERED:
+                    self._dropped += 1
+                    self.dropped_count += 1
+                self.buf.append(entry)
+            wake = not self._pending
+            self._pending = True
+        if wake:
+            self._wake.emit()
+    
+    @Slot()
+    def _schedule_flush(self):
+        QTimer.singleShot(self.BATCH_INTERVAL_MS, self._flush)
+    
+    @Slot()
+    def _flush(self):
+        with self._lock:
+            entries, self.buf = self.buf, deque(maxlen=self.MAX_BUFFERED)
+            errors, self._errors = self._errors, deque()
+            dropped, self._dropped = self._dropped, 0
+            self._pending = False
+        if dropped:
+            self.records_dropped.emit(dropped)
+        if entries or errors:
+            merged = heapq.merge(entries, errors) if errors else entries
+            self.log_batch.emit([entry[1:] for entry in merged])
+
+
+# Timestamp format shared by every handler; the console shows only the time part
+_ASCTIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+_TIME_PART = slice(11, None)
+
+# (second, formatted) for the most recently stamped second
+_asctime_cache = (-1, '')
+
+
+def _stamp_asctime(record: logging.LogRecord) -> str:
+    """Set record.asctime once per record, formatting each second only once.
+    
+    Every handler calls this, so a record's timestamp is computed by whichever
+    handler sees it first and reused by the rest.
+    """
+    global _asctime_cache
+    asctime = record.__dict__.get('asctime')
+    if asctime is None:
+        sec = int(record.created)
+        cached_sec, asctime = _asctime_cache
+        if sec != cached_sec:
+            asctime = time.strftime(_ASCTIME_FORMAT, time.localtime(sec))
+            _asctime_cache = (sec, asctime)
+        record.asctime = asctime
+    return asctime
+
+
+class CachedAsctimeFormatter(logging.Formatter):
+    """Formatter whose asctime comes from the shared per-record stamp (always _ASCTIME_FORMAT)."""
+    
+    def formatTime(self, record, datefmt=None):
+        return _stamp_asctime(record)
 
 
 class GUILogHandler(logging.Handler):
@@ -21,53 +133,172 @@ class GUILogHandler(logging.Handler):
     def __init__(self, signal_emitter: LogSignalEmitter):
         super().__init__()
         self.signal_emitter = signal_emitter
-        self.setFormatter(logging.Formatter('%(message)s'))
     
     def emit(self, record):
         try:
+            # The panel only shows the message text, so skip the Formatter
+            msg = record.getMessage()
+            level = _LEVEL_NAMES.get(record.levelno, record.levelname)
+            self.signal_emitter.add(level, _stamp_asctime(record), msg, record.levelno)
+        except Exception:
+            self.handleError(record)
+
+
+class FastStderrHandler(logging.Handler):
+    """Console handler that writes the fixed console format straight to stderr."""
+    
+    def __init__(self, stream=None):
+        super().__init__()
+        self.stream = stream if stream is not None else sys.stderr
+    
+    def emit(self, record):
+        try:
+            timestamp = _stamp_asctime(record)[_TIME_PART]
+            level = _LEVEL_NAMES.get(record.levelno, record.levelname)
+            self.stream.write(f'[{level}] {timestamp} | {record.getMessage()}\n')
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BufferedFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """Midnight-rotating file handler with a large write buffer that only flushes eagerly for errors."""
+    
+    BUFFER_SIZE = 64 * 1024
+    BACKUP_COUNT = 7
+    
+    def __init__(self, filename, encoding=None, delay=False):
+        super().__init__(
+            filename, when='midnight', backupCount=self.BACKUP_COUNT,
+            encoding=encoding, delay=delay
+        )
+    
+    def _open(self):
+        return open(
+            self.baseFilename, self.mode, buffering=self.BUFFER_SIZE,
+            encoding=self.encoding, errors=self.errors
+        )
+    
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
             msg = self.format(record)
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            self.signal_emitter.log_message.emit(
-                record.levelname,
-                timestamp,
-                msg
-            )
+            self.stream.write(msg + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except RecursionError:
+            raise
         except Exception:
             self.handleError(record)
+    
+    def emit_batch(self, records):
+        """Format a batch of records and write them with a single write call."""
+        lines = []
+        flush = False
+        for record in records:
+            if record.levelno < self.level or not self.filter(record):
+                continue
+            try:
+                lines.append(self.format(record) + self.terminator)
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(record)
+                continue
+            flush = flush or record.levelno >= logging.ERROR
+        if not lines:
+            return
+        
+        self.acquire()
+        try:
+            if self.shouldRollover(records[-1]):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(''.join(lines))
+            if flush:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(records[-1])
+        finally:
+            self.release()
 
 
-class Logger:
-    """Application logger with file and GUI output."""
+class BatchingMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes itself and its target every FLUSH_INTERVAL seconds."""
+    
+    FLUSH_INTERVAL = 30.0  # seconds
+    
+    def __init__(self, capacity: int, flushLevel: int, target: logging.Handler):
+        super().__init__(capacity, flushLevel=flushLevel, target=target, flushOnClose=True)
+        # Flush on a timer so quiet periods don't leave records in memory
+        self._stop_flushing = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically, name='log-flush', daemon=True
+        )
+        self._flush_thread.start()
+    
+    def _flush_periodically(self):
+        while not self._stop_flushing.wait(self.FLUSH_INTERVAL):
+            self.flush()
+            target = self.target
+            if target is not None:
+                target.flush()
+    
+    def flush(self):
+        """Hand the whole buffer to the target at once when it supports batches."""
+        self.acquire()
+        try:
+            emit_batch = getattr(self.target, 'emit_batch', None)
+            if emit_batch is None:
+                super().flush()
+            elif self.buffer:
+                emit_batch(self.buffer)
+                self.buffer = []
+        finally:
+            self.release()
     
-    _instance = None
+    def close(self):
+        self._stop_flushing.set()
+        target = self.target
+        super().close()
+        if target is not None:
+            target.flush()
+
+
+class Logger:
+    """Application logger with file and GUI output.
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    Use get_logger(); the single instance is created when this module is imported.
+    """
     
     def __init__(self):
-        if self._initialized:
-            return
+        # Skip LogRecord fields none of our formats use
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+        logging.logAsyncioTasks = False  # Python 3.12+; harmless before
+        # No format uses filename/lineno, so skip the findCaller() stack walk
+        logging._srcfile = None
         
-        self._initialized = True
         self.signal_emitter = LogSignalEmitter()
         self.logger = logging.getLogger('yt-dlp-gui')
         self.logger.setLevel(logging.DEBUG)
+        self._is_enabled = self.logger.isEnabledFor
         
-        # Prevent duplicate handlers
-        self.logger.handlers.clear()
-        
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        console_format = logging.Formatter(
-            '[%(levelname)s] %(asctime)s | %(message)s',
-            datefmt='%H:%M:%S'
-        )
-        console_handler.setFormatter(console_format)
-        self.logger.addHandler(console_handler)
+        # Console handler (windowed builds have no stderr)
+        if sys.stderr is not None:
+            console_handler = FastStderrHandler()
+            console_handler.setLevel(logging.INFO)
+            self.logger.addHandler(console_handler)
         
         # GUI handler
         gui_handler = GUILogHandler(self.signal_emitter)
@@ -78,42 +309,71 @@ class Logger:
         self._setup_file_handler()
     
     def _setup_file_handler(self):
-        """Setup rotating file handler."""
-        log_dir = Path(os.path.dirname(os.path.abspath(__file__))).parent.parent / 'logs'
-        log_dir.mkdir(exist_ok=True)
-        
-        log_file = log_dir / f'yt-dlp-gui_{datetime.now().strftime("%Y%m%d")}.log'
+        """Setup file handler.
         
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        File writes happen on a QueueListener thread; callers only enqueue the record.
+        """
+        file_handler = BufferedFileHandler(_LOG_FILE, encoding='utf-8', delay=True)
         file_handler.setLevel(logging.DEBUG)
-        file_format = logging.Formatter(
+        file_format = CachedAsctimeFormatter(
             '[%(levelname)s] %(asctime)s | %(name)s | %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
+            datefmt=_ASCTIME_FORMAT
         )
         file_handler.setFormatter(file_format)
-        self.logger.addHandler(file_handler)
+        
+        # Batch records in memory; ERROR and above are written immediately
+        self._file_buffer = BatchingMemoryHandler(512, logging.ERROR, file_handler)
+        
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._file_listener = logging.handlers.QueueListener(
+            log_queue, self._file_buffer, respect_handler_level=True
+        )
+        self._file_listener.start()
+        atexit.register(self._shutdown_file_logging)
+    
+    def _shutdown_file_logging(self):
+        """Drain queued records, then write out anything still buffered."""
+        self._file_listener.stop()
+        self._file_buffer.close()
+    
+    # Each method checks the level first so disabled levels cost a single call;
+    # extra args are %-formatted by the handlers, only if the record is emitted.
     
-    def debug(self, message: str):
-        self.logger.debug(message)
+    def debug(self, message: str, *args):
+        if self._is_enabled(logging.DEBUG):
+            self.logger.debug(message, *args)
     
-    def info(self, message: str):
-        self.logger.info(message)
+    def info(self, message: str, *args):
+        if self._is_enabled(logging.INFO):
+            self.logger.info(message, *args)
     
-    def warning(self, message: str):
-        self.logger.warning(message)
+    def warning(self, message: str, *args):
+        if self._is_enabled(logging.WARNING):
+            self.logger.warning(message, *args)
     
-    def error(self, message: str):
-        self.logger.error(message)
+    def error(self, message: str, *args):
+        if self._is_enabled(logging.ERROR):
+            self.logger.error(message, *args)
     
-    def critical(self, message: str):
-        self.logger.critical(message)
+    def critical(self, message: str, *args):
+        if self._is_enabled(logging.CRITICAL):
+            self.logger.critical(message, *args)
     
     def get_signal_emitter(self) -> LogSignalEmitter:
         """Get the signal emitter for GUI connection."""
         return self.signal_emitter
 
 
+def _construct() -> Logger:
+    """Create the application logger; runs once, at import."""
+    return Logger()
+
+
 # Global logger instance
+_logger = _construct()
+
+
 def get_logger() -> Logger:
     """Get the singleton logger instance."""
-    return Logger()
+    return _logger
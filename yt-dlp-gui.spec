@@ -19,6 +19,7 @@ a = Analysis(
     datas=[
         ('yt-dlp.exe', '.'),  # Include yt-dlp executable
         ('assets/icon.ico', 'assets'),  # Include app icon
+        ('src/ui/themes/theme.qss', 'src/ui/themes'),  # Include theme stylesheet template
     ],
     hiddenimports=[
         'PySide6.QtCore',